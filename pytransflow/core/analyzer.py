@@ -12,8 +12,6 @@ from pytransflow.exceptions import (
 from pytransflow.core.record import Record
 from pytransflow.core.transformation import Transformation
 from pytransflow.exceptions import AnalyzerBaseException
-from pytransflow.core.resolver import Resolver
-from pytransflow.core.condition import Condition
 
 
 logger = logging.getLogger(__name__)
@@ -32,6 +30,9 @@ class Analyzer:
 
     Attributes:
         config: Transformation configuration
+        variables: Flow variables
+        path_separator: Flow level path separator
+        condition: Compiled transformation condition
         record: Record to be analyzed
 
     """
@@ -43,16 +44,25 @@ class Analyzer:
     ) -> None:
         self.config = transformation.config
         self.variables = transformation.variables
+        self.path_separator = transformation.path_separator
+        self.condition = transformation.condition
         self.record = record
 
-    def should_perform_transformation(self) -> bool:
-        """Performs the analysis"""
+    def should_perform_transformation(self, check_condition: bool = True) -> bool:
+        """Performs the analysis
+
+        Args:
+            check_condition: If False the transformation condition is not checked, e.g. because
+                it's checked for a batch of records at once
+
+        """
         required_fields = self.config.get_required_fields()
         output_fields = self.config.get_output_fields()
         try:
             self._check_required_fields(fields=required_fields)
             self._check_output_field(output_fields=output_fields, record=self.record)
-            self._check_condition(self.record)
+            if check_condition:
+                self._check_condition(self.record)
             return True
         except AnalyzerBaseException as a_err:
             if isinstance(a_err, ConditionNotMetException):
@@ -74,11 +84,9 @@ class Analyzer:
             ConditionNotMet: If condition fails to be checked or is not met
 
         """
-        condition = self.config.schema.condition
-        if condition is not None:
-            condition = Resolver.resolve_condition(condition, self.variables)
-            Condition.check(condition, record)
-            logger.debug("Checking condition: %s", condition)
+        if self.condition is not None:
+            logger.debug("Checking condition: %s", self.condition.condition)
+            self.condition.check(record, self.variables, self.path_separator)
 
     def _check_required_fields(
         self,
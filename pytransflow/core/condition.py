@@ -2,25 +2,57 @@
 Defines classes and methods related to ``Condition``
 """
 
+import ast
 import logging
-from simpleeval import simple_eval  # type: ignore
-from pytransflow.exceptions import ConditionNotMetException
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from simpleeval import (  # type: ignore
+    DEFAULT_OPERATORS,
+    DISALLOW_FUNCTIONS,
+    MAX_STRING_LENGTH,
+    InvalidExpression,
+    SimpleEval as Evaluator,
+)
+from pytransflow.exceptions import ConditionNotMetException, FlowVariableDoesNotExistException
 from pytransflow.core.record import Record
 from pytransflow.core.eval import SimpleEval
+from pytransflow.core.resolver import Resolver
+from pytransflow.core.flow.variables import FlowVariables
+
+try:
+    import numpy as np  # type: ignore[import-not-found, unused-ignore]
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
 
 logger = logging.getLogger(__name__)
 
+_local = threading.local()
+
+Predicate = Callable[[Record], Any]
+BatchPredicate = Callable[[Sequence[Record]], Optional[List[bool]]]
+
 
 class Condition:
     """Implements methods that handle conditions"""
 
     @staticmethod
-    def check(condition: str, record: Record) -> bool:
-        """Checks condition using simpleeval
+    def check(
+        condition: str,
+        record: Record,
+        parsed: Optional[Any] = None,
+        predicate: Optional[Predicate] = None,
+    ) -> bool:
+        """Checks condition using simpleeval, or the predicate compiled from the condition
 
         Args:
             condition: Condition expression
             record: Record
+            parsed: Condition expression parsed by ``Condition.parse``, if not provided the
+                expression is parsed
+            predicate: Condition expression compiled by ``ConditionCompiler``, if provided
+                it's used instead of simpleeval
 
         Returns:
             True if condition is met, otherwise false
@@ -30,11 +62,11 @@ class Condition:
 
         """
         try:
-            if not simple_eval(
-                condition,
-                names={"record": record},
-                functions=SimpleEval.functions,
-            ):
+            if predicate is not None:
+                result = predicate(record)
+            else:
+                result = Condition._evaluate(condition, record, parsed)
+            if not result:
                 logger.warning("Condition not met!")
                 raise ConditionNotMetException(condition)
             logger.debug("Condition met!")
@@ -45,3 +77,649 @@ class Condition:
         except SyntaxError as err:
             logger.error("Condition syntax is not defined properly!")
             raise RuntimeError(f"Condition syntax '{condition}' is not defined properly") from err
+
+    @staticmethod
+    def check_many(
+        condition: str,
+        records: Sequence[Record],
+        parsed: Optional[Any] = None,
+        predicate: Optional[Predicate] = None,
+        vectorized: Optional[BatchPredicate] = None,
+    ) -> List[bool]:
+        """Checks condition for a batch of records
+
+        The condition is evaluated in a single call for the whole batch, using NumPy when it's
+        available and the condition is vectorizable, see ``ConditionVectorizer``. Otherwise,
+        the condition is checked record by record.
+
+        Args:
+            condition: Condition expression
+            records: Batch of records
+            parsed: Condition expression parsed by ``Condition.parse``, if not provided the
+                expression is parsed and compiled
+            predicate: Condition expression compiled by ``ConditionCompiler``
+            vectorized: Condition expression vectorized by ``ConditionVectorizer``
+
+        Returns:
+            For each record, True if condition is met, otherwise false
+
+        """
+        if parsed is None:
+            parsed = Condition.parse(condition)
+            predicate = ConditionCompiler.compile(parsed)
+            vectorized = ConditionVectorizer.vectorize(parsed)
+        if vectorized is not None and len(records) >= ConditionVectorizer.min_batch_size:
+            result = vectorized(records)
+            if result is not None:
+                return result
+        results = []
+        for record in records:
+            try:
+                if predicate is not None:
+                    results.append(bool(predicate(record)))
+                else:
+                    results.append(bool(Condition._evaluate(condition, record, parsed)))
+            except (KeyError, TypeError) as err:
+                logger.debug("Condition not met, error: %s", err)
+                results.append(False)
+        return results
+
+    @staticmethod
+    def _evaluate(condition: str, record: Record, parsed: Optional[Any]) -> Any:
+        """Evaluates condition using simpleeval
+
+        Args:
+            condition: Condition expression
+            record: Record
+            parsed: Parsed condition expression
+
+        Returns:
+            Result of the evaluation
+
+        """
+        evaluator = Condition._evaluator()
+        evaluator.names = {"record": record}
+        try:
+            return evaluator.eval(condition, previously_parsed=parsed)
+        finally:
+            evaluator.names = {}
+
+    @staticmethod
+    def parse(condition: str) -> Any:
+        """Parses condition expression
+
+        Args:
+            condition: Condition expression
+
+        Returns:
+            Parsed expression
+
+        Raises:
+            RuntimeError - If condition syntax is not defined properly
+
+        """
+        try:
+            return Evaluator.parse(condition)
+        except SyntaxError as err:
+            logger.error("Condition syntax is not defined properly!")
+            raise RuntimeError(f"Condition syntax '{condition}' is not defined properly") from err
+
+    @staticmethod
+    def _evaluator() -> Evaluator:
+        """Returns simpleeval evaluator of the current thread
+
+        The evaluator is created once per thread and recreated when custom evaluation functions
+        are added, see ``SimpleEval.add_function``.
+
+        Returns:
+            simpleeval evaluator
+
+        """
+        evaluator = getattr(_local, "evaluator", None)
+        if evaluator is None or _local.version != SimpleEval.version:
+            evaluator = Evaluator(functions=SimpleEval.functions)
+            _local.evaluator = evaluator
+            _local.version = SimpleEval.version
+        return evaluator
+
+
+class UnsupportedExpression(Exception):
+    """Raised when an expression cannot be compiled to a predicate"""
+
+
+class ConditionCompiler:
+    """Implements compiler of condition expressions to native Python closures
+
+    Parsed expressions are compiled to closures that evaluate the expression directly on the
+    record data, without walking the expression tree on every record. Only the expression
+    shapes whose semantics can be reproduced exactly are compiled: constants, record fields,
+    comparisons and membership tests, boolean, arithmetic and unary operations, conditional
+    expressions and calls of the registered ``SimpleEval`` functions. The operators are the
+    same functions simpleeval uses, so the results and the raised errors are the same.
+    Other expressions are evaluated using simpleeval.
+
+    Attributes:
+        operators: Operators by the type of the expression node
+
+    """
+
+    operators: Dict[Any, Callable[..., Any]] = DEFAULT_OPERATORS
+
+    @classmethod
+    def compile(cls, parsed: Any) -> Optional[Predicate]:
+        """Compiles parsed expression to a predicate
+
+        Args:
+            parsed: Expression parsed by ``Condition.parse``
+
+        Returns:
+            Predicate, None if the expression cannot be compiled
+
+        """
+        try:
+            return cls._compile(parsed)
+        except UnsupportedExpression as err:
+            logger.debug("Expression is evaluated using simpleeval: %s", err)
+            return None
+
+    @classmethod
+    def _compile(cls, node: Any) -> Predicate:
+        """Compiles expression node
+
+        Args:
+            node: Expression node
+
+        Returns:
+            Closure that evaluates the node
+
+        Raises:
+            UnsupportedExpression: If the node cannot be compiled
+
+        """
+        compiler = getattr(cls, f"_compile_{type(node).__name__.lower()}", None)
+        if compiler is None:
+            raise UnsupportedExpression(type(node).__name__)
+        return compiler(node)  # type: ignore[no-any-return]
+
+    @classmethod
+    def _compile_expr(cls, node: ast.Expr) -> Predicate:
+        """Compiles expression statement"""
+        return cls._compile(node.value)
+
+    @staticmethod
+    def _compile_name(node: ast.Name) -> Predicate:
+        """Compiles name, only the record is available in conditions"""
+        if node.id != "record":
+            raise UnsupportedExpression(f"Name {node.id}")
+        return lambda record: record
+
+    @classmethod
+    def _compile_binop(cls, node: ast.BinOp) -> Predicate:
+        """Compiles binary operation"""
+        operator = cls._operator(node.op)
+        left, right = cls._compile(node.left), cls._compile(node.right)
+        return lambda record: operator(left(record), right(record))
+
+    @classmethod
+    def _compile_unaryop(cls, node: ast.UnaryOp) -> Predicate:
+        """Compiles unary operation"""
+        operator = cls._operator(node.op)
+        operand = cls._compile(node.operand)
+        return lambda record: operator(operand(record))
+
+    @classmethod
+    def _compile_ifexp(cls, node: ast.IfExp) -> Predicate:
+        """Compiles conditional expression"""
+        test, body, orelse = (cls._compile(x) for x in (node.test, node.body, node.orelse))
+        return lambda record: body(record) if test(record) else orelse(record)
+
+    @staticmethod
+    def _compile_constant(node: ast.Constant) -> Predicate:
+        """Compiles constant, too long constants are left to simpleeval"""
+        value: Any = node.value
+        if hasattr(value, "__len__") and len(value) > MAX_STRING_LENGTH:
+            raise UnsupportedExpression("Constant is too long")
+        return lambda record: value
+
+    @classmethod
+    def _compile_subscript(cls, node: ast.Subscript) -> Predicate:
+        """Compiles subscript, record field paths are read directly from the record data"""
+        keys: List[Any] = []
+        element: Any = node
+        while isinstance(element, ast.Subscript):
+            key = cls.subscript_key(element)
+            if not isinstance(key, ast.Constant):
+                break
+            keys.insert(0, key.value)
+            element = element.value
+        if isinstance(element, ast.Name) and element.id == "record":
+            return cls._compile_path(keys)
+        container = cls._compile(node.value)
+        key_value = cls._compile(cls.subscript_key(node))
+        return lambda record: container(record)[key_value(record)]
+
+    @staticmethod
+    def subscript_key(node: ast.Subscript) -> Any:
+        """Returns subscript key node"""
+        key = node.slice
+        if isinstance(key, ast.Index):  # pragma: no cover
+            return key.value  # type: ignore[attr-defined]
+        if isinstance(key, ast.Slice):
+            raise UnsupportedExpression("Slice")
+        return key
+
+    @staticmethod
+    def _compile_path(keys: List[Any]) -> Predicate:
+        """Compiles record field path"""
+        if len(keys) == 1:
+            first = keys[0]
+            return lambda record: record.data[first]
+        if len(keys) == 2:
+            first, second = keys
+            return lambda record: record.data[first][second]
+
+        def path(record: Record) -> Any:
+            element = record.data
+            for key in keys:
+                element = element[key]
+            return element
+
+        return path
+
+    @classmethod
+    def _compile_compare(cls, node: ast.Compare) -> Predicate:
+        """Compiles comparison, chained comparisons are evaluated like in simpleeval"""
+        left = cls._compile(node.left)
+        operators = [cls._operator(x) for x in node.ops]
+        comparators = [cls._compile(x) for x in node.comparators]
+        if len(operators) == 1:
+            operator, right = operators[0], comparators[0]
+            return lambda record: operator(left(record), right(record))
+        pairs = list(zip(operators, comparators))
+
+        def compare(record: Record) -> Any:
+            right_value = left(record)
+            result: Any = True
+            for operator, comparator in pairs:
+                if not result:
+                    break
+                left_value = right_value
+                right_value = comparator(record)
+                result = operator(left_value, right_value)
+            return result
+
+        return compare
+
+    @classmethod
+    def _compile_boolop(cls, node: ast.BoolOp) -> Predicate:
+        """Compiles boolean operation"""
+        values = [cls._compile(x) for x in node.values]
+        if isinstance(node.op, ast.And):
+
+            def and_(record: Record) -> Any:
+                result: Any = False
+                for value in values:
+                    result = value(record)
+                    if not result:
+                        break
+                return result
+
+            return and_
+
+        def or_(record: Record) -> Any:
+            result: Any = False
+            for value in values:
+                result = value(record)
+                if result:
+                    break
+            return result
+
+        return or_
+
+    @classmethod
+    def _compile_call(cls, node: ast.Call) -> Predicate:
+        """Compiles call of a registered function with positional arguments"""
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise UnsupportedExpression("Call")
+        function = SimpleEval.functions.get(node.func.id)
+        if function is None or function in DISALLOW_FUNCTIONS:
+            raise UnsupportedExpression(f"Function {node.func.id}")
+        arguments = [cls._compile(x) for x in node.args]
+        return lambda record: function(*(x(record) for x in arguments))
+
+    @classmethod
+    def _operator(cls, operator: Any) -> Callable[..., Any]:
+        """Returns operator function"""
+        if type(operator) not in cls.operators:
+            raise UnsupportedExpression(type(operator).__name__)
+        return cls.operators[type(operator)]
+
+
+class Missing:
+    """Marks a field missing from a record"""
+
+
+MISSING = Missing()
+
+
+class NotVectorizable(Exception):
+    """Raised when the values of a batch cannot be evaluated using NumPy"""
+
+
+class ConditionVectorizer:
+    """Implements vectorized evaluation of conditions over batches of records
+
+    Comparisons of flat record fields with numeric or string constants, combined using
+    boolean operations, are evaluated on NumPy arrays built from the field values of the
+    whole batch. Every expression node is evaluated to a pair of masks, the records for which
+    the evaluation succeeds, i.e. it doesn't raise ``KeyError`` or ``TypeError`` as a missing
+    field does, and the values of the node. The masks are combined following the short
+    circuiting of boolean operations, so the result is the same as checking the condition
+    for each record. Batches whose field values are not all of the type of the constant are
+    evaluated record by record.
+
+    Attributes:
+        min_batch_size: Minimal number of records evaluated using NumPy
+        max_exact_integer: Largest integer that's exactly represented as a float
+
+    """
+
+    min_batch_size = 512
+    max_exact_integer = 2**53
+    comparisons: Dict[Any, Any] = {
+        ast.Eq: ast.Eq,
+        ast.NotEq: ast.NotEq,
+        ast.Gt: ast.Lt,
+        ast.Lt: ast.Gt,
+        ast.GtE: ast.LtE,
+        ast.LtE: ast.GtE,
+    }
+
+    @classmethod
+    def vectorize(cls, parsed: Any) -> Optional[BatchPredicate]:
+        """Vectorizes parsed expression
+
+        Args:
+            parsed: Expression parsed by ``Condition.parse``
+
+        Returns:
+            Batch predicate, None if NumPy is not available or the expression cannot be
+            vectorized. Batch predicate returns None if the batch cannot be vectorized.
+
+        """
+        if not HAS_NUMPY:  # pragma: no cover
+            return None
+        try:
+            masks = cls._vectorize(parsed)
+        except UnsupportedExpression:
+            return None
+
+        def batch(records: Sequence[Record]) -> Optional[List[bool]]:
+            try:
+                valid, value = masks(records)
+            except NotVectorizable as err:
+                logger.debug("Batch cannot be vectorized: %s", err)
+                return None
+            return (valid & value).tolist()  # type: ignore[no-any-return]
+
+        return batch
+
+    @classmethod
+    def _vectorize(cls, node: Any) -> Callable[[Sequence[Record]], Tuple[Any, Any]]:
+        """Vectorizes expression node
+
+        Args:
+            node: Expression node
+
+        Returns:
+            Function that evaluates the node for a batch of records to a pair of masks
+
+        Raises:
+            UnsupportedExpression: If the node cannot be vectorized
+
+        """
+        if isinstance(node, ast.Expr):
+            return cls._vectorize(node.value)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = cls._vectorize(node.operand)
+
+            def not_(records: Sequence[Record]) -> Tuple[Any, Any]:
+                valid, value = operand(records)
+                return valid, ~value
+
+            return not_
+        if isinstance(node, ast.BoolOp):
+            return cls._vectorize_boolop(node)
+        if isinstance(node, ast.Compare):
+            return cls._vectorize_compare(node)
+        raise UnsupportedExpression(type(node).__name__)
+
+    @classmethod
+    def _vectorize_boolop(cls, node: ast.BoolOp) -> Callable[[Sequence[Record]], Tuple[Any, Any]]:
+        """Vectorizes boolean operation"""
+        values = [cls._vectorize(x) for x in node.values]
+        is_and = isinstance(node.op, ast.And)
+
+        def boolop(records: Sequence[Record]) -> Tuple[Any, Any]:
+            valid, value = values[0](records)
+            for operand in values[1:]:
+                operand_valid, operand_value = operand(records)
+                if is_and:
+                    valid = valid & (~value | operand_valid)
+                    value = value & operand_value
+                else:
+                    valid = valid & (value | operand_valid)
+                    value = value | operand_value
+            return valid, value
+
+        return boolop
+
+    @classmethod
+    def _vectorize_compare(cls, node: ast.Compare) -> Callable[[Sequence[Record]], Tuple[Any, Any]]:
+        """Vectorizes comparison of a flat record field with a constant"""
+        if len(node.ops) != 1 or type(node.ops[0]) not in cls.comparisons:
+            raise UnsupportedExpression("Comparison")
+        operator_type = type(node.ops[0])
+        field, constant = node.left, node.comparators[0]
+        if isinstance(field, ast.Constant):
+            field, constant = constant, field
+            operator_type = cls.comparisons[operator_type]
+        key = cls._field(field)
+        value = cls._constant(constant)
+        operator = ConditionCompiler.operators[operator_type]
+
+        def compare(records: Sequence[Record]) -> Tuple[Any, Any]:
+            values, valid = cls._values(records, key, value)
+            return valid, operator(values, value)
+
+        return compare
+
+    @staticmethod
+    def _field(node: Any) -> Any:
+        """Returns the key of a flat record field"""
+        if (
+            isinstance(node, ast.Subscript)
+            and isinstance(node.value, ast.Name)
+            and node.value.id == "record"
+        ):
+            key = ConditionCompiler.subscript_key(node)
+            if isinstance(key, ast.Constant):
+                return key.value
+        raise UnsupportedExpression("Field")
+
+    @classmethod
+    def _constant(cls, node: Any) -> Any:
+        """Returns numeric or string constant"""
+        if isinstance(node, ast.Constant):
+            value = node.value
+            if isinstance(value, str) and not value.endswith("\0"):
+                return value
+            if cls._is_exact_number(value):
+                return value
+        raise UnsupportedExpression("Constant")
+
+    @classmethod
+    def _values(cls, records: Sequence[Record], key: Any, constant: Any) -> Tuple[Any, Any]:
+        """Builds array of field values and the mask of records that contain the field
+
+        Args:
+            records: Batch of records
+            key: Field key
+            constant: Constant the field is compared with
+
+        Returns:
+            Array of values and mask of valid records
+
+        Raises:
+            NotVectorizable: If values are not of the type of the constant
+
+        """
+        values = [record.data.get(key, MISSING) for record in records]
+        types = set(map(type, values))
+        if Missing in types:
+            valid = np.array([x is not MISSING for x in values], dtype=bool)
+            values = [constant if x is MISSING else x for x in values]
+            types.discard(Missing)
+        else:
+            valid = np.ones(len(values), dtype=bool)
+        if isinstance(constant, str):
+            if types - {str} or "\0" in "".join(values):
+                raise NotVectorizable(f"Field '{key}' values are not strings")
+            return np.array(values, dtype=str), valid
+        if types - {int, float} or (
+            int in types and max(abs(min(values)), abs(max(values))) > cls.max_exact_integer
+        ):
+            raise NotVectorizable(f"Field '{key}' values are not numbers")
+        return np.array(values, dtype=float), valid
+
+    @classmethod
+    def _is_exact_number(cls, value: Any) -> bool:
+        """Checks if the value is a number that's exactly represented as a float"""
+        if isinstance(value, float):
+            return True
+        if isinstance(value, int) and not isinstance(value, bool):
+            return abs(value) <= cls.max_exact_integer
+        return False
+
+
+class CompiledCondition:
+    """Implements a condition that's resolved and compiled once
+
+    The condition is resolved for record fields and flow variables, parsed and compiled to a
+    predicate by ``ConditionCompiler`` on the first check, or ahead of time with ``compile``.
+    Subsequent checks only call the predicate, or evaluate the parsed expression using
+    simpleeval if the expression cannot be compiled. Flow variable values are bound when the
+    condition is compiled, so the condition is compiled again only if the flow variables or
+    the registered functions change.
+
+    Args:
+        condition: Condition expression, as defined in the flow configuration
+
+    Attributes:
+        condition: Condition expression, as defined in the flow configuration
+
+    """
+
+    def __init__(self, condition: str) -> None:
+        self.condition = condition
+        self._compiled: Optional[
+            Tuple[Tuple[Any, ...], str, Any, Optional[Predicate], Optional[BatchPredicate]]
+        ] = None
+
+    def __getstate__(self) -> Any:
+        return {"condition": self.condition, "_compiled": None}
+
+    def check(
+        self,
+        record: Record,
+        variables: Optional[FlowVariables] = None,
+        path_separator: Optional[str] = None,
+    ) -> bool:
+        """Checks condition
+
+        Args:
+            record: Record
+            variables: Flow variables
+            path_separator: Path separator
+
+        Returns:
+            True if condition is met, otherwise false
+
+        Raises:
+            ConditionNotMetException - If condition is not met
+
+        """
+        expression, parsed, predicate, _ = self.compile(variables, path_separator)
+        return Condition.check(expression, record, parsed, predicate)
+
+    def check_many(
+        self,
+        records: Sequence[Record],
+        variables: Optional[FlowVariables] = None,
+        path_separator: Optional[str] = None,
+    ) -> List[bool]:
+        """Checks condition for a batch of records
+
+        Args:
+            records: Batch of records
+            variables: Flow variables
+            path_separator: Path separator
+
+        Returns:
+            For each record, True if condition is met, otherwise false
+
+        """
+        expression, parsed, predicate, vectorized = self.compile(variables, path_separator)
+        return Condition.check_many(expression, records, parsed, predicate, vectorized)
+
+    def compile(
+        self,
+        variables: Optional[FlowVariables] = None,
+        path_separator: Optional[str] = None,
+    ) -> Tuple[str, Any, Optional[Predicate], Optional[BatchPredicate]]:
+        """Resolves, parses and compiles the condition, unless it's already compiled
+
+        Args:
+            variables: Flow variables
+            path_separator: Path separator
+
+        Returns:
+            Resolved expression, parsed expression, predicate and batch predicate, if the
+            expression can be compiled and vectorized
+
+        """
+        key = (
+            path_separator,
+            id(variables),
+            variables.version if variables is not None else None,
+            SimpleEval.version,
+        )
+        compiled = self._compiled
+        if compiled is not None and compiled[0] == key:
+            return compiled[1], compiled[2], compiled[3], compiled[4]
+        logger.debug("Compiling condition: %s", self.condition)
+        expression = Resolver.resolve_condition(self.condition, variables, path_separator)
+        parsed = Condition.parse(expression)
+        predicate = ConditionCompiler.compile(parsed)
+        vectorized = ConditionVectorizer.vectorize(parsed)
+        self._compiled = (key, expression, parsed, predicate, vectorized)
+        return expression, parsed, predicate, vectorized
+
+    def warm(
+        self,
+        variables: Optional[FlowVariables] = None,
+        path_separator: Optional[str] = None,
+    ) -> None:
+        """Compiles the condition ahead of time
+
+        Conditions that cannot be compiled are left to fail when they are checked.
+
+        Args:
+            variables: Flow variables
+            path_separator: Path separator
+
+        """
+        try:
+            self.compile(variables, path_separator)
+        except (RuntimeError, InvalidExpression, FlowVariableDoesNotExistException) as err:
+            logger.debug("Condition cannot be compiled ahead of time, error: %s", err)
@@ -3,7 +3,7 @@ Defines classes and methods related to the ``Controller``
 """
 
 import logging
-from typing import Union
+from typing import List, Union
 from pytransflow.core.record import FailedRecord, Record
 from pytransflow.core.analyzer import Analyzer
 from pytransflow.core.transformation import Transformation
@@ -45,13 +45,93 @@ class Controller:
                 return record
             return transformation.execute(record)
         except (AnalyzerBaseException, TransformationBaseException) as err:
-            logger.warning("Transformation failed with error: %s", err)
-            return FailedRecord(
-                record=record,
-                transformation_name=transformation.__class__.__name__,
-                transformation_configuration=transformation.config,
-                error=err,
+            return Controller._failed_record(record, transformation, err)
+        except Exception as e_err:
+            logger.error("Unexpected Controller Transformation Failure, error: %s", e_err)
+            raise ControllerTransformationFailedException(e_err) from e_err
+
+    @staticmethod
+    async def aprocess_record(
+        record: Record,
+        transformation: Transformation,
+    ) -> Union[Record, FailedRecord]:
+        """Applies transformation to a record in an async flow, if something goes wrong returns
+        a FailedRecord"""
+        analyzer = Analyzer(transformation, record)
+        try:
+            logger.debug(
+                "Controller async process: Transformation: %s, record: %s",
+                transformation,
+                record,
+            )
+            if not analyzer.should_perform_transformation():
+                return record
+            return await transformation.aexecute(record)
+        except (AnalyzerBaseException, TransformationBaseException) as err:
+            return Controller._failed_record(record, transformation, err)
+        except Exception as e_err:
+            logger.error("Unexpected Controller Transformation Failure, error: %s", e_err)
+            raise ControllerTransformationFailedException(e_err) from e_err
+
+    @staticmethod
+    def process_batch(
+        records: List[Record],
+        transformation: Transformation,
+    ) -> List[Union[Record, FailedRecord]]:
+        """Applies transformation to a batch of records, records that fail are returned as
+        FailedRecords
+
+        Records are analyzed one by one, while the condition of the transformation is checked
+        for the whole batch at once. Records that should be transformed are passed to the
+        transformation as a single batch, see ``Transformation.execute_batch``.
+
+        """
+        results: List[Union[Record, FailedRecord]] = list(records)
+        try:
+            logger.debug(
+                "Controller batch process: Transformation: %s, records: %d",
+                transformation,
+                len(records),
             )
+            selected = []
+            for index, record in enumerate(records):
+                try:
+                    analyzer = Analyzer(transformation, record)
+                    if analyzer.should_perform_transformation(check_condition=False):
+                        selected.append(index)
+                except AnalyzerBaseException as err:
+                    results[index] = Controller._failed_record(record, transformation, err)
+            if transformation.condition is not None and selected:
+                checks = transformation.condition.check_many(
+                    [records[i] for i in selected],
+                    transformation.variables,
+                    transformation.path_separator,
+                )
+                selected = [index for index, met in zip(selected, checks) if met]
+            transformed = transformation.execute_batch([records[i] for i in selected])
+            for index, result in zip(selected, transformed):
+                if isinstance(result, TransformationBaseException):
+                    results[index] = Controller._failed_record(
+                        records[index], transformation, result
+                    )
+                else:
+                    results[index] = result
         except Exception as e_err:
             logger.error("Unexpected Controller Transformation Failure, error: %s", e_err)
             raise ControllerTransformationFailedException(e_err) from e_err
+        return results
+
+    @staticmethod
+    def _failed_record(
+        record: Record,
+        transformation: Transformation,
+        err: Exception,
+    ) -> FailedRecord:
+        """Creates a failed record from the error raised while applying a transformation"""
+        logger.warning("Transformation failed with error: %s", err)
+        return FailedRecord(
+            record=record,
+            transformation_name=transformation.__class__.__name__,
+            transformation_configuration=transformation.config,
+            error=err,
+        )
@@ -12,6 +12,7 @@ class SimpleEval:
 
     Attributes:
         functions - Evaluating functions
+        version - Incremented when a function is added
 
     Note:
         Default functions will be automatically included, allowing users to
@@ -20,6 +21,7 @@ class SimpleEval:
     """
 
     functions: Dict[str, Any] = {**DEFAULT_FUNCTIONS}
+    version = 0
 
     @classmethod
     def add_function(cls, name: str, function: Any) -> None:
@@ -37,3 +39,4 @@ class SimpleEval:
                 "Function object is not callable, hence it cannot be used for evaluating."
             )
         cls.functions[name] = function
+        cls.version += 1
@@ -9,7 +9,8 @@ from pytransflow.core.transformation import (
     TransformationConfiguration,
     TransformationCatalogue,
 )
-from pytransflow.core.flow.schema import FlowSchema
+from pytransflow.core.configuration import TransflowConfiguration
+from pytransflow.core.flow.schema import FlowSchema, FlowExecutorChoices
 from pytransflow.core.flow.variables import FlowVariables
 from pytransflow.core.flow.fail_scenario import FlowFailScenario
 
@@ -25,10 +26,13 @@ class FlowConfiguration:  # pylint: disable=too-many-instance-attributes
     Attributes:
         batch: Number of records in a batch
         cores: Number of cores used in multiprocessing mode
+        executor: Executor used in parallel mode
+        execution: Execution engine of the flow pipeline
         fail_scenarios: Flow fail scenarios
         instant_fail: If True flow should fail if one record fails
-        path_separator: Flow level path separator
+        path_separator: Flow level path separator, defaults to the Transflow configuration
         parallel: If multiprocessing mode is enabled
+        preserve_order: If results of parallel processing keep the order of the records
         variables: Flow level variables
         transformations: List of Transformation objects
 
@@ -40,10 +44,21 @@ class FlowConfiguration:  # pylint: disable=too-many-instance-attributes
     ) -> None:
         self.batch = flow_schema.batch
         self.cores = flow_schema.cores
+        self.executor = (
+            flow_schema.executor
+            if flow_schema.executor is not None
+            else FlowExecutorChoices.PROCESS
+        )
+        self.execution = flow_schema.execution
         self.fail_scenarios = FlowFailScenario(flow_schema.fail_scenarios)
         self.instant_fail = flow_schema.instant_fail
-        self.path_separator = flow_schema.path_separator
+        self.path_separator = (
+            flow_schema.path_separator
+            if flow_schema.path_separator is not None
+            else TransflowConfiguration().path_separator
+        )
         self.parallel = flow_schema.parallel
+        self.preserve_order = flow_schema.preserve_order
         self.variables = FlowVariables(flow_schema.variables)
         self.transformations = self._resolve_transformations(flow_schema.transformations)
 
@@ -69,6 +84,7 @@ class FlowConfiguration:  # pylint: disable=too-many-instance-attributes
                 transformation_config = TransformationConfiguration(schema=schema, config=t_config)
                 resolved_transformation = transformation(transformation_config)
                 resolved_transformation.variables = self.variables
+                resolved_transformation.path_separator = self.path_separator
                 resolved_transformations.append(resolved_transformation)
         logger.debug(
             "Number of resolved transformations: %d",
@@ -2,10 +2,15 @@
 Defines classes and method related to the ``Datasets``
 """
 
+from __future__ import annotations
 import logging
-from typing import Dict, Any, List
-from pytransflow.core.record import Record
-from pytransflow.core.flow.pipeline import FlowPipelineState
+from uuid import uuid4
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from pytransflow.core.record import Record, FailedRecord
+from pytransflow.core.flow.pipeline import FlowPipelineState, CompactFailure
+
+if TYPE_CHECKING:
+    from pytransflow.core.transformation import Transformation
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +21,9 @@ class FailedDataset:
     This dataset contains original record and all failed records that it encountered during the
     processing of the original record within a single pipeline job
 
+    Failed datasets created from a compact failure, e.g. when records are processed in
+    parallel mode, reconstruct failed records and the run ID only when they are accessed.
+
     Args:
         state: Flow Pipeline State
 
@@ -27,9 +35,62 @@ class FailedDataset:
     """
 
     def __init__(self, state: FlowPipelineState) -> None:
-        self.failed_records = state.failed_records
         self.record = state.init_record
-        self.run_id = state.run_id
+        self._failed_records: Optional[List[FailedRecord]] = state.failed_records
+        self._run_id: Optional[str] = state.run_id
+        self._compact: Optional[CompactFailure] = None
+        self._transformations: List[Transformation] = []
+
+    @classmethod
+    def from_compact(
+        cls,
+        failure: CompactFailure,
+        transformations: List[Transformation],
+        path_separator: Optional[str] = None,
+    ) -> FailedDataset:
+        """Creates Failed Dataset from a compact failure
+
+        Args:
+            failure: Compact failure
+            transformations: Transformations of the flow pipeline that produced the failure
+            path_separator: Path separator of the records
+
+        Returns:
+            Failed Dataset
+
+        """
+        dataset = cls.__new__(cls)
+        dataset.record = Record(failure.record, path_separator)
+        dataset._failed_records = None
+        dataset._run_id = None
+        dataset._compact = failure
+        dataset._transformations = transformations
+        return dataset
+
+    @property
+    def failed_records(self) -> List[FailedRecord]:
+        """Returns records that failed the processing"""
+        if self._failed_records is None:
+            self._failed_records = []
+            if self._compact is not None:
+                for index, data, error in self._compact.failures:
+                    transformation = self._transformations[index]
+                    self._failed_records.append(
+                        FailedRecord(
+                            record=Record(data, self.record.path_separator),
+                            transformation_name=transformation.__class__.__name__,
+                            transformation_configuration=transformation.config,
+                            error=error,
+                        )
+                    )
+        return self._failed_records
+
+    @property
+    def run_id(self) -> str:
+        """Returns pipeline job run ID"""
+        if self._run_id is None:
+            self._run_id = str(uuid4())
+        return self._run_id
 
 
 class Datasets:
@@ -63,18 +124,29 @@ class Datasets:
         """
         self.failed_records.append(FailedDataset(state))
 
+    def add_failed_dataset(self, dataset: FailedDataset) -> None:
+        """Add failed dataset to the Dataset
+
+        Args:
+            dataset: Failed dataset
+
+        """
+        self.failed_records.append(dataset)
+
     def add_input_records(
         self,
         records: List[Dict[Any, Any]],
+        path_separator: Optional[str] = None,
     ) -> None:
         """Adds initial records to default dataset
 
         Args:
             records: Initial records
+            path_separator: Path separator of the records
 
         """
         logger.debug("Initializing State with: %s", records)
-        self.input_records = [Record(x) for x in records]
+        self.input_records = [Record(x, path_separator) for x in records]
 
     def add_to_dataset(
         self,
@@ -4,7 +4,6 @@ Defines classes and methods related to the ``FlowFailScenario``
 
 from enum import Enum
 from typing import Dict, Any, Optional, List
-from pytransflow.core.flow.dataset import Datasets
 from pytransflow.core.flow.statistics import FlowStatistics
 from pytransflow.exceptions import (
     FlowFailScenarioValueNotProperlyDefinedException,
@@ -57,11 +56,10 @@ class FlowFailScenario:
                 if not isinstance(value, list) or value == []:
                     raise FlowFailScenarioValueNotProperlyDefinedException(choice.value)
 
-    def evaluate(self, datasets: Datasets, statistics: FlowStatistics) -> None:
+    def evaluate(self, statistics: FlowStatistics) -> None:
         """Evaluates flow fail scenarios and triggers flow failure if condition is met
 
         Args:
-            datasets: Flow Datasets
             statistics: Flow statistics
 
         """
@@ -71,9 +69,9 @@ class FlowFailScenario:
             if choice is FlowFailScenarioChoices.FAILED_RECORDS:
                 self._evaluate_failed_records(statistics, value)
             if choice is FlowFailScenarioChoices.DATASETS_PRESENT:
-                self._evaluate_dataset_present(datasets, value)
+                self._evaluate_dataset_present(statistics, value)
             if choice is FlowFailScenarioChoices.DATASETS_NOT_PRESENT:
-                self._evaluate_dataset_not_present(datasets, value)
+                self._evaluate_dataset_not_present(statistics, value)
 
     @staticmethod
     def _evaluate_percentage(statistics: FlowStatistics, threshold: int) -> None:
@@ -114,18 +112,18 @@ class FlowFailScenario:
             )
 
     @staticmethod
-    def _evaluate_dataset_present(datasets: Datasets, values: List[str]) -> None:
+    def _evaluate_dataset_present(statistics: FlowStatistics, values: List[str]) -> None:
         """Evaluates Dataset Present flow fail scenario
 
         Args:
-            datasets: Flow Datasets
-            dataset: Dataset name
+            statistics: Flow Statistics
+            values: Dataset names
 
         Raises:
             FlowFailScenarioException - If scenario condition is met
 
         """
-        dataset_names = datasets.get_dataset_names()
+        dataset_names = statistics.dataset_names
         for dataset in values:
             if dataset in dataset_names:
                 raise FlowFailScenarioException(
@@ -134,18 +132,18 @@ class FlowFailScenario:
                 )
 
     @staticmethod
-    def _evaluate_dataset_not_present(datasets: Datasets, values: List[str]) -> None:
+    def _evaluate_dataset_not_present(statistics: FlowStatistics, values: List[str]) -> None:
         """Evaluates Dataset Not Present flow fail scenario
 
         Args:
-            datasets: Flow Datasets
-            dataset: Dataset name
+            statistics: Flow Statistics
+            values: Dataset names
 
         Raises:
             FlowFailScenarioException - If scenario condition is met
 
         """
-        dataset_names = datasets.get_dataset_names()
+        dataset_names = statistics.dataset_names
         for dataset in values:
             if dataset not in dataset_names:
                 raise FlowFailScenarioException(
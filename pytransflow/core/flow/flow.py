@@ -2,24 +2,35 @@
 Defines classes and methods related to the ``Flow``
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from types import TracebackType
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple, Type, Union
+from typing_extensions import Self
 from pytransflow.core.record import Record
 from pytransflow.exceptions import (
     FlowFailedException,
     FlowInstantFailException,
     FlowPipelineInstantFailException,
 )
-from pytransflow.core.configuration import TransflowConfiguration
 from pytransflow.core.flow.dataset import Datasets, FailedDataset
 from pytransflow.core.flow.configuration import FlowConfiguration
 from pytransflow.core.flow.loader import FlowConfigurationLoader
 from pytransflow.core.flow.statistics import FlowStatistics
-from pytransflow.core.flow.pipeline import FlowPipeline, FlowPipelineResult
-from pytransflow.core.flow.parallel import ParallelFlow
+from pytransflow.core.flow.pipeline import (
+    FlowPipeline,
+    FlowPipelineResult,
+    FlowPipelineBatchResult,
+    CompactFailure,
+)
+from pytransflow.core.flow.parallel import ParallelFlow, BatchResult
+from pytransflow.core.flow.schema import FlowExecutionChoices
 
 logger = logging.getLogger(__name__)
 
+FlowEvent = Tuple[Optional[str], Union[Record, FailedDataset]]
+
 
 class Flow:
     """Implements Flow
@@ -32,15 +43,23 @@ class Flow:
     argument as a `dict` object. Note: `config` argument has precedence over
     `name`.
 
+    In parallel mode the flow owns a multiprocessing pool that is created on the first
+    processing and reused by the subsequent ones. The pool is shut down with `close()` or
+    by using the flow as a context manager.
+
     Args:
         name: Name of the flow configuration file i.e. `<name>.yml`
         config: Flow configuration as a `dict` object
 
     Attributes:
         statistics: Flow Statistics object
+        stream_batch_size: Number of records pulled from the stream at once when the flow
+            pipeline is executed in the batch mode
 
     """
 
+    stream_batch_size = 100
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -52,9 +71,18 @@ class Flow:
         self._pipeline: FlowPipeline = FlowPipeline(
             self._config.transformations, self._config.instant_fail
         )
+        self._parallel: Optional[ParallelFlow] = None
 
-        if self._config.path_separator is not None:
-            TransflowConfiguration().path_separator = self._config.path_separator
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
 
     @property
     def datasets(self) -> Dict[str, List[Record]]:
@@ -74,34 +102,199 @@ class Flow:
             records: Records to process
 
         """
-        self._datasets.add_input_records(records)
+        self._datasets.add_input_records(records, self._config.path_separator)
         self.statistics.before_processing()
         if self._config.parallel:
             self._multi_processing()
         else:
             self._single_processing()
         self.statistics.after_processing()
-        self._config.fail_scenarios.evaluate(self._datasets, self.statistics)
+        self._config.fail_scenarios.evaluate(self.statistics)
+
+    async def aprocess(self, records: List[Dict[str, Any]]) -> None:
+        """Prepares inital dataset and processes records concurrently on the running event loop
+
+        Every record moves through the flow pipeline in its own task, so async transformations
+        of different records are awaited concurrently, up to the ``concurrency`` limit of each
+        transformation. Results are added to the datasets in the order of the input records.
+
+        Args:
+            records: Records to process
+
+        """
+        self._datasets.add_input_records(records, self._config.path_separator)
+        self.statistics.before_processing()
+        await self._async_processing()
+        self.statistics.after_processing()
+        self._config.fail_scenarios.evaluate(self.statistics)
+
+    def close(self) -> None:
+        """Releases resources held by the flow, i.e. shuts down the multiprocessing pool"""
+        if self._parallel is not None:
+            self._parallel.close()
+            self._parallel = None
+
+    def process_iter(self, records: Iterable[Dict[str, Any]]) -> Iterator[FlowEvent]:
+        """Processes records lazily and yields the results as soon as each record is processed
+
+        Records are pulled from the iterable one at a time and nothing is retained in the flow
+        datasets, so the memory usage doesn't grow with the input. Flow statistics are updated
+        incrementally and flow fail scenarios are evaluated once the stream is exhausted. In
+        parallel mode records are pulled in batches and only a bounded number of batches is
+        processed at any time.
+
+        Args:
+            records: Records to process
+
+        Yields:
+            ``(dataset_name, record)`` for every output record and ``(None, failed_dataset)``
+            for every record that failed the processing
+
+        """
+        logger.debug("Initializing flow processing in streaming mode")
+        self.statistics.start_stream()
+        if self._config.parallel:
+            for batch in self._execute_parallel(self._count_input_records(records)):
+                yield from self._stream_batch_result(batch)
+        elif self._config.execution == FlowExecutionChoices.BATCH:
+            iterator = self._count_input_records(records)
+            while True:
+                batch_records = list(islice(iterator, self.stream_batch_size))
+                if not batch_records:
+                    break
+                yield from self._stream_pipeline_batch_result(self._submit_batch(batch_records))
+        else:
+            for record in self._count_input_records(records):
+                yield from self._stream_pipeline_result(self._submit(record))
+        self.statistics.end_stream()
+        self._config.fail_scenarios.evaluate(self.statistics)
 
     def _single_processing(self) -> None:
         """Executes flow in a single process"""
         logger.debug("Initializing flow processing in single-process mode")
+        if self._config.execution == FlowExecutionChoices.BATCH:
+            self._add_pipeline_batch_result(self._submit_batch(self._datasets.input_records))
+            return
         for record in self._datasets.input_records:
-            try:
-                result = self._pipeline.submit(record)
-                self._add_pipeline_result(result)
-            except FlowPipelineInstantFailException as i_err:
-                raise FlowInstantFailException() from i_err
-            except Exception as e_err:
-                raise FlowFailedException(e_err) from e_err
+            self._add_pipeline_result(self._submit(record))
+
+    async def _async_processing(self) -> None:
+        """Executes flow on the running event loop"""
+        logger.debug("Initializing flow processing in async mode")
+        limits = self._pipeline.create_limits()
+        tasks = [
+            asyncio.ensure_future(self._asubmit(record, limits))
+            for record in self._datasets.input_records
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        for result in results:
+            self._add_pipeline_result(result)
+
+    async def _asubmit(
+        self,
+        record: Record,
+        limits: Dict[int, asyncio.Semaphore],
+    ) -> FlowPipelineResult:
+        """Submits a record to the async flow pipeline and translates pipeline failures
+
+        Args:
+            record: Record to be processed
+            limits: Concurrency limits of the transformations
+
+        Returns:
+            Flow Pipeline Result
+
+        """
+        try:
+            return await self._pipeline.asubmit(record, limits)
+        except FlowPipelineInstantFailException as i_err:
+            raise FlowInstantFailException() from i_err
+        except Exception as e_err:
+            raise FlowFailedException(e_err) from e_err
+
+    def _submit(self, record: Record) -> FlowPipelineResult:
+        """Submits a record to the flow pipeline and translates pipeline failures
+
+        Args:
+            record: Record to be processed
+
+        Returns:
+            Flow Pipeline Result
+
+        """
+        try:
+            return self._pipeline.submit(record)
+        except FlowPipelineInstantFailException as i_err:
+            raise FlowInstantFailException() from i_err
+        except Exception as e_err:
+            raise FlowFailedException(e_err) from e_err
+
+    def _submit_batch(self, records: List[Record]) -> FlowPipelineBatchResult:
+        """Submits a batch of records to the flow pipeline and translates pipeline failures
+
+        Args:
+            records: Records to be processed
+
+        Returns:
+            Flow Pipeline Batch Result
+
+        """
+        try:
+            return self._pipeline.submit_batch(records)
+        except FlowPipelineInstantFailException as i_err:
+            raise FlowInstantFailException() from i_err
+        except Exception as e_err:
+            raise FlowFailedException(e_err) from e_err
 
     def _multi_processing(self) -> None:
         """Executes flow in multiprocessing mode"""
         logger.debug("Initializing flow processing in multi-processing mode")
-        mt_flow = ParallelFlow(self._datasets.input_records, self._config)
-        results = mt_flow.execute()
-        for result in results:
-            self._add_pipeline_result(result)
+        for batch in self._execute_parallel(self._datasets.input_records):
+            for name, data in batch.datasets.items():
+                self._datasets.add_to_dataset(
+                    name, [Record(x, self._config.path_separator) for x in data]
+                )
+            for failure in batch.failures:
+                self._datasets.add_failed_dataset(self._failed_dataset(failure))
+
+    def _execute_parallel(self, records: Iterable[Record]) -> Iterator[BatchResult]:
+        """Executes records in parallel and yields batch results as they are collected
+
+        Args:
+            records: Records to be processed
+
+        Yields:
+            Batch Results
+
+        """
+        if self._parallel is None:
+            self._parallel = ParallelFlow(self._config)
+        try:
+            for batch in self._parallel.execute(records):
+                self.statistics.add_batch(batch.size, batch.worker, batch.busy_time)
+                yield batch
+        except FlowPipelineInstantFailException as i_err:
+            raise FlowInstantFailException() from i_err
+
+    def _count_input_records(self, records: Iterable[Dict[str, Any]]) -> Iterator[Record]:
+        """Wraps streamed records and counts them in the flow statistics
+
+        Args:
+            records: Records to process
+
+        Yields:
+            Records
+
+        """
+        for data in records:
+            self.statistics.add_input_record()
+            yield Record(data, self._config.path_separator)
 
     def _add_pipeline_result(self, result: FlowPipelineResult) -> None:
         if not result.success:
@@ -110,3 +303,82 @@ class Flow:
 
         for name, records in result.state.dataset.items():
             self._datasets.add_to_dataset(name, records)
+
+    def _add_pipeline_batch_result(self, result: FlowPipelineBatchResult) -> None:
+        for name, records in result.datasets.items():
+            self._datasets.add_to_dataset(name, records)
+        for state in result.failed:
+            self._datasets.add_failed_records(state)
+
+    def _stream_pipeline_result(self, result: FlowPipelineResult) -> Iterator[FlowEvent]:
+        """Updates flow statistics and yields the events of a single pipeline result
+
+        Args:
+            result: Flow Pipeline Result
+
+        Yields:
+            Flow events
+
+        """
+        if not result.success:
+            self.statistics.add_failed_record()
+            yield None, FailedDataset(result.state)
+            return
+
+        for name, records in result.state.dataset.items():
+            for record in records:
+                self.statistics.add_output_record(name)
+                yield name, record
+
+    def _stream_pipeline_batch_result(
+        self,
+        result: FlowPipelineBatchResult,
+    ) -> Iterator[FlowEvent]:
+        """Updates flow statistics and yields the events of a pipeline batch result
+
+        Args:
+            result: Flow Pipeline Batch Result
+
+        Yields:
+            Flow events
+
+        """
+        for name, records in result.datasets.items():
+            for record in records:
+                self.statistics.add_output_record(name)
+                yield name, record
+        for state in result.failed:
+            self.statistics.add_failed_record()
+            yield None, FailedDataset(state)
+
+    def _stream_batch_result(self, batch: BatchResult) -> Iterator[FlowEvent]:
+        """Updates flow statistics and yields the events of a batch processed in parallel
+
+        Args:
+            batch: Batch Result
+
+        Yields:
+            Flow events
+
+        """
+        for name, data in batch.datasets.items():
+            for record in data:
+                self.statistics.add_output_record(name)
+                yield name, Record(record, self._config.path_separator)
+        for failure in batch.failures:
+            self.statistics.add_failed_record()
+            yield None, self._failed_dataset(failure)
+
+    def _failed_dataset(self, failure: CompactFailure) -> FailedDataset:
+        """Reconstructs failed dataset from a compact failure of a batch processed in parallel
+
+        Args:
+            failure: Compact failure
+
+        Returns:
+            Failed Dataset
+
+        """
+        return FailedDataset.from_compact(
+            failure, self._config.transformations, self._config.path_separator
+        )
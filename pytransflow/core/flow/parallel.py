@@ -4,100 +4,412 @@ Defines classes and methods related to the ``ParallelFlow``
 
 import logging
 import os
-from typing import List, Optional
-from multiprocessing import Pool
+import threading
+import time
+from collections import deque
+from itertools import islice
+from queue import SimpleQueue
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sized, Union
+from multiprocessing import Event
+from multiprocessing.pool import AsyncResult, Pool, ThreadPool
+from multiprocessing.synchronize import Event as EventType
+from pytransflow.exceptions import FlowPipelineInstantFailException
 from pytransflow.core.record import Record
 from pytransflow.core.transformation import Transformation
-from pytransflow.core.flow.pipeline import FlowPipeline, FlowPipelineResult
+from pytransflow.core.flow.pipeline import (
+    FlowPipeline,
+    FlowPipelineResult,
+    FlowPipelineBatchResult,
+    CompactFailure,
+)
 from pytransflow.core.flow.configuration import FlowConfiguration
+from pytransflow.core.flow.schema import FlowExecutorChoices, FlowExecutionChoices
+from pytransflow.core.flow.scheduler import BatchScheduler
 
 
 logger = logging.getLogger(__name__)
 
 
-def process_batch(  # pragma: no cover
-    records: List[Record],
+class BatchResult:
+    """Defines the result of a processed batch
+
+    The result is sent from a worker to the parent process in a compact format. Records of
+    successfully processed pipelines are grouped by the output dataset and stored as plain
+    data, while failed pipelines are stored as compact failures.
+
+    Args:
+        size: Number of processed records
+        worker: ID of the worker process or thread
+        busy_time: Time the worker spent processing the batch in seconds
+
+    Attributes:
+        size: Number of processed records
+        datasets: Data of the output records grouped by the dataset name
+        failures: Records that failed the processing
+        worker: ID of the worker process or thread
+        busy_time: Time the worker spent processing the batch in seconds
+
+    """
+
+    def __init__(self, size: int, worker: int, busy_time: float) -> None:
+        self.size = size
+        self.datasets: Dict[str, List[Dict[Any, Any]]] = {}
+        self.failures: List[CompactFailure] = []
+        self.worker = worker
+        self.busy_time = busy_time
+
+    def add_pipeline_result(self, pipeline: FlowPipeline, result: FlowPipelineResult) -> None:
+        """Adds Flow Pipeline Result to the batch result
+
+        Args:
+            pipeline: Flow Pipeline that produced the result
+            result: Flow Pipeline Result
+
+        """
+        if not result.success:
+            self.failures.append(pipeline.compact_failure(result.state))
+            return
+        for name, records in result.state.dataset.items():
+            if name not in self.datasets:
+                self.datasets[name] = []
+            self.datasets[name].extend(record.data for record in records)
+
+    def add_pipeline_batch_result(
+        self,
+        pipeline: FlowPipeline,
+        result: FlowPipelineBatchResult,
+    ) -> None:
+        """Adds Flow Pipeline Batch Result to the batch result
+
+        Args:
+            pipeline: Flow Pipeline that produced the result
+            result: Flow Pipeline Batch Result
+
+        """
+        for name, records in result.datasets.items():
+            self.datasets[name] = [record.data for record in records]
+        self.failures.extend(pipeline.compact_failure(state) for state in result.failed)
+
+
+class WorkerState:
+    """Holds the state of a worker process
+
+    The state is installed once, when the worker process starts, so the tasks sent to the
+    worker carry only the records that should be processed.
+
+    Attributes:
+        pipeline: Flow pipeline used by the worker
+        cancelled: Event shared by all workers, set when the processing should stop
+        execution: Execution engine of the flow pipeline
+
+    """
+
+    pipeline: Optional[FlowPipeline] = None
+    cancelled: Optional[EventType] = None
+    execution = FlowExecutionChoices.RECORD
+
+
+def initialize_worker(  # pragma: no cover
     transformations: List[Transformation],
     instant_fail: bool,
-) -> List[FlowPipelineResult]:
-    """Executes processing task
+    cancelled: EventType,
+    execution: FlowExecutionChoices = FlowExecutionChoices.RECORD,
+) -> None:
+    """Initializes worker process by building the flow pipeline
 
     Args:
-        records: Batch of records to be processed
         transformations: List of transformations to be applied
         instant_fail: Configuration for instant failure
+        cancelled: Cancellation event shared by all workers
+        execution: Execution engine of the flow pipeline
+
+    """
+    WorkerState.pipeline = FlowPipeline(transformations, instant_fail)
+    WorkerState.cancelled = cancelled
+    WorkerState.execution = execution
+
+
+def process_batch(records: List[Record]) -> BatchResult:  # pragma: no cover
+    """Executes processing task using the pipeline installed in the worker
+
+    Args:
+        records: Batch of records to be processed
+
+    Returns:
+        Batch result
+
+    """
+    pipeline = WorkerState.pipeline
+    cancelled = WorkerState.cancelled
+    if pipeline is None or cancelled is None:
+        raise RuntimeError("Worker process is not initialized")
+    return run_batch(pipeline, cancelled, records, os.getpid(), WorkerState.execution)
+
+
+def run_batch(
+    pipeline: FlowPipeline,
+    cancelled: Union[EventType, threading.Event],
+    records: List[Record],
+    worker: int,
+    execution: FlowExecutionChoices = FlowExecutionChoices.RECORD,
+) -> BatchResult:
+    """Processes a batch of records using the flow pipeline
+
+    The cancellation event is checked between records, so the remaining records of the batch
+    are skipped as soon as some worker raises the instant fail. With the batch execution, the
+    whole batch is submitted to the pipeline at once and the event is checked only before the
+    batch is processed.
+
+    Args:
+        pipeline: Flow pipeline
+        cancelled: Cancellation event shared by all workers
+        records: Batch of records to be processed
+        worker: ID of the worker process or thread
+        execution: Execution engine of the flow pipeline
+
+    Returns:
+        Batch result
 
     """
-    pipeline = FlowPipeline(transformations, instant_fail)
-    result = []
+    start = time.perf_counter()
+    result = BatchResult(0, worker, 0.0)
+    if execution == FlowExecutionChoices.BATCH:
+        if cancelled.is_set():
+            logger.debug("Processing cancelled, skipping the batch")
+            return result
+        try:
+            result.add_pipeline_batch_result(pipeline, pipeline.submit_batch(records))
+        except FlowPipelineInstantFailException:
+            cancelled.set()
+            raise
+        result.size = len(records)
+        result.busy_time = time.perf_counter() - start
+        return result
     for record in records:
-        result.append(pipeline.submit(record))
+        if cancelled.is_set():
+            logger.debug("Processing cancelled, skipping the rest of the batch")
+            break
+        try:
+            result.add_pipeline_result(pipeline, pipeline.submit(record))
+        except FlowPipelineInstantFailException:
+            cancelled.set()
+            raise
+        result.size += 1
+    result.busy_time = time.perf_counter() - start
     return result
 
 
-class ParallelFlow:
+class ParallelFlow:  # pylint: disable=too-many-instance-attributes
     """Implements Flow execution in parallel mode
 
+    The pool is created lazily on the first execution and it's reused by all subsequent
+    executions until the parallel flow is closed. With the process executor, the flow
+    pipeline is sent to each worker process only once, through the pool initializer. With the
+    thread executor, a single flow pipeline is shared by the worker threads, records are not
+    pickled and the batch results are merged in the calling thread.
+
+    Records are pulled from the input lazily and at most ``in_flight_factor`` batches per core
+    are submitted to the pool at any time. Batch results are yielded as they are collected,
+    either in the order of the records or in the order of completion.
+
+    If a batch fails, e.g. because of the instant fail, the workers are signaled to stop and
+    the pool is terminated, so the outstanding batches are discarded. A new pool is created
+    on the next execution.
+
+    Args:
+        config: Flow configuration
+
     Attributes:
-        batch: Number of records in a batch
-        cores: Number of cores used for multiprocessing
+        cores: Number of worker processes or threads
+        executor: Executor used to run the pool
+        execution: Execution engine of the flow pipeline
         instant_fail: Instant fail configuration
+        preserve_order: If True batch results are yielded in the order of the records
         transformations: List of transformation to be applied
-        records: Records to be processed
+        scheduler: Batch scheduler
+        in_flight_factor: Maximal number of submitted batches per core
 
     """
 
-    def __init__(
-        self,
-        records: List[Record],
-        config: FlowConfiguration,
-    ) -> None:
-        self.records = records
+    in_flight_factor = 2
+
+    def __init__(self, config: FlowConfiguration) -> None:
+        self.executor = config.executor
         self.instant_fail = config.instant_fail
+        self.preserve_order = config.preserve_order
         self.transformations = config.transformations
-        self.batch = self._set_batch(config.batch)
-        self.cores = self._set_cores(config.cores)
+        self.execution = config.execution
+        if self.executor == FlowExecutorChoices.THREAD:
+            self.cores = self._set_threads(config.cores)
+        else:
+            self.cores = self._set_cores(config.cores)
+        self.scheduler = BatchScheduler(self.cores, config.batch)
+        self._pool: Optional[Pool] = None
+        self._cancelled: Optional[Union[EventType, threading.Event]] = None
+        self._task: Callable[[List[Record]], BatchResult] = process_batch
 
-    def execute(self) -> List[FlowPipelineResult]:
-        """Executes the multiprocessing pool
+    def execute(self, records: Iterable[Record]) -> Iterator[BatchResult]:
+        """Executes records using the pool
 
-        Returns:
-            List of FlowPipelineResults
+        Args:
+            records: Records to be processed
+
+        Yields:
+            BatchResults as they are collected from the workers
 
         """
         logger.debug(
-            "Initializing Multiprocessing Pool, cores: %s, batch: %s",
+            "Executing on %s pool, cores: %s, preserve order: %s",
+            self.executor.value,
             self.cores,
-            self.batch,
+            self.preserve_order,
         )
-        with Pool(self.cores) as pool:
-            processes = []
-            for i in range(0, len(self.records), self.batch):
-                batch = self.records[i : i + self.batch]
-                process = pool.apply_async(
-                    process_batch, (batch, self.transformations, self.instant_fail)
+        pool = self._get_pool()
+        try:
+            yield from self._execute(pool, records)
+        except BaseException:
+            self._cancel()
+            raise
+
+    def _execute(self, pool: Pool, records: Iterable[Record]) -> Iterator[BatchResult]:
+        """Submits batches to the pool and collects the results
+
+        Args:
+            pool: Process or thread pool
+            records: Records to be processed
+
+        Yields:
+            BatchResults as they are collected from the workers
+
+        """
+        remaining = len(records) if isinstance(records, Sized) else None
+        iterator = iter(records)
+        submitted: Deque["AsyncResult[BatchResult]"] = deque()
+        completed: "SimpleQueue[Union[BatchResult, BaseException]]" = SimpleQueue()
+        exhausted = False
+        while True:
+            while not exhausted and len(submitted) < self.in_flight_factor * self.cores:
+                batch = list(islice(iterator, self.scheduler.next_size(remaining)))
+                if not batch:
+                    exhausted = True
+                    break
+                if remaining is not None:
+                    remaining -= len(batch)
+                if self.preserve_order:
+                    submitted.append(pool.apply_async(self._task, (batch,)))
+                else:
+                    submitted.append(
+                        pool.apply_async(
+                            self._task,
+                            (batch,),
+                            callback=completed.put,
+                            error_callback=completed.put,
+                        )
+                    )
+            if not submitted:
+                return
+            batch_result = self._collect(submitted, completed)
+            self.scheduler.update(batch_result.size, batch_result.busy_time)
+            yield batch_result
+
+    def _collect(
+        self,
+        submitted: Deque["AsyncResult[BatchResult]"],
+        completed: "SimpleQueue[Union[BatchResult, BaseException]]",
+    ) -> BatchResult:
+        """Waits for the next batch result
+
+        Args:
+            submitted: Submitted batches, in the order of the records
+            completed: Batch results in the order of completion
+
+        Returns:
+            Batch result
+
+        """
+        if self.preserve_order:
+            return submitted.popleft().get()
+        submitted.pop()
+        result = completed.get()
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def close(self) -> None:
+        """Shuts down the pool"""
+        if self._pool is not None:
+            logger.debug("Shutting down %s pool", self.executor.value)
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _cancel(self) -> None:
+        """Signals the workers to stop and terminates the pool, discarding pending batches"""
+        if self._pool is not None and self._cancelled is not None:
+            logger.debug("Cancelling outstanding batches, terminating %s pool", self.executor.value)
+            self._cancelled.set()
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def _get_pool(self) -> Pool:
+        """Returns the pool, creates it if it doesn't exist
+
+        Returns:
+            Process or thread pool
+
+        """
+        if self._pool is None:
+            logger.debug("Initializing %s pool, cores: %s", self.executor.value, self.cores)
+            if self.executor == FlowExecutorChoices.THREAD:
+                self._pool = self._create_thread_pool()
+            else:
+                cancelled = Event()
+                self._cancelled = cancelled
+                self._task = process_batch
+                self._pool = Pool(
+                    self.cores,
+                    initializer=initialize_worker,
+                    initargs=(self.transformations, self.instant_fail, cancelled, self.execution),
                 )
-                processes.append(process)
+        return self._pool
 
-            result = []
-            for process in processes:
-                result.extend(process.get())
+    def _create_thread_pool(self) -> ThreadPool:
+        """Creates the thread pool and the task that runs batches on the shared pipeline
 
-            return result
+        Returns:
+            Thread pool
+
+        """
+        pipeline = FlowPipeline(self.transformations, self.instant_fail)
+        cancelled = threading.Event()
+        self._cancelled = cancelled
+
+        execution = self.execution
+
+        def task(records: List[Record]) -> BatchResult:
+            return run_batch(pipeline, cancelled, records, threading.get_ident(), execution)
+
+        self._task = task
+        return ThreadPool(self.cores)
+
+    @staticmethod
+    def _set_threads(threads: Optional[int]) -> int:
+        """Sets number of worker threads
 
-    def _set_batch(self, batch: Optional[int]) -> int:
-        """Sets batch size
+        Threads that wait on I/O don't occupy a core, so the number of threads is not limited
+        by the number of available cores.
 
         Args:
-            batch: Batch size flow configuration
+            threads: Number of cores flow configuration
 
         Returns:
-            Batch size
+            Number of worker threads
 
         """
-        if batch is not None:
-            return batch
-        return len(self.records)
+        if threads is not None:
+            return threads
+        return min(32, (os.cpu_count() or 1) + 4)
 
     @staticmethod
     def _set_cores(cores: Optional[int]) -> int:
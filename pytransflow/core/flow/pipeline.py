@@ -2,12 +2,11 @@
 Defines classes and methods related to the ``FlowPipeline``
 """
 
+import asyncio
 import logging
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple, Union
 from copy import deepcopy
 from uuid import uuid4
-from pytransflow.core.resolver import Resolver
-from pytransflow.core.condition import Condition
 from pytransflow.core.record import Record, FailedRecord
 from pytransflow.core.controller import Controller
 from pytransflow.core.transformation import (
@@ -15,7 +14,7 @@ from pytransflow.core.transformation import (
     TransformationConfiguration,
     OutputDataset,
 )
-from pytransflow.exceptions import FlowPipelineInstantFailException, ConditionNotMetException
+from pytransflow.exceptions import FlowPipelineInstantFailException
 from pytransflow.core.configuration import TransflowConfiguration
 
 logger = logging.getLogger(__name__)
@@ -83,6 +82,109 @@ class FlowPipelineState:
         self.failed_records.append(record)
 
 
+class FlowPipelineBatchState:
+    """Implements Flow Pipeline State that's kept during processing of a batch of records
+
+    Every record in the datasets keeps the index of the submitted record it originates from,
+    so the results and failures can be attributed to the submitted records.
+
+    Args:
+        pipeline_id: Pipeline ID
+        records: Submitted records
+
+    Attributes:
+        pipeline_id: Pipeline ID
+        init_records: Submitted records
+        dataset: Datasets present during processing
+        origins: Indexes of the submitted records that the records in the datasets originate from
+        failed_records: Records that failed processing, by the index of the submitted record
+
+    """
+
+    def __init__(self, pipeline_id: str, records: List[Record]) -> None:
+        logger.debug("Initialize FlowPipelineBatchState with %d records", len(records))
+        self.pipeline_id = pipeline_id
+        self.init_records = records
+        default_dataset = TransflowConfiguration().default_dataset_name
+        self.dataset = {default_dataset: list(records)}
+        self.origins = {default_dataset: list(range(len(records)))}
+        self.failed_records: Dict[int, List[FailedRecord]] = {}
+
+    def get_records(self, dataset: str) -> Tuple[List[int], List[Record]]:
+        """Returns records from a dataset
+
+        Args:
+            dataset: Dataset name
+
+        Returns:
+            Origins of the records and list of records
+
+        """
+        if dataset in self.dataset:
+            return self.origins.pop(dataset), self.dataset.pop(dataset)
+        return [], []
+
+    def add_transformation_results(
+        self,
+        origins: List[int],
+        records: List[Record],
+        dataset: OutputDataset,
+    ) -> None:
+        """Adds Transformation results to a dataset
+
+        Args:
+            origins: Origins of the transformed records
+            records: Transformed records
+            dataset: Output dataset
+
+        """
+        if not records:
+            return
+        if dataset.name not in self.dataset:
+            self.dataset[dataset.name] = []
+            self.origins[dataset.name] = []
+        self.dataset[dataset.name].extend(deepcopy(record) for record in records)
+        self.origins[dataset.name].extend(origins)
+
+    def add_failed_record(self, origin: int, record: FailedRecord) -> None:
+        """Adds failed record to the pipeline state
+
+        Args:
+            origin: Index of the submitted record
+            record: Failed record
+
+        """
+        self.failed_records.setdefault(origin, []).append(record)
+
+
+class CompactFailure:
+    """Defines a compact representation of a record that failed the processing
+
+    Failed records refer to the transformation that failed by its index in the flow pipeline
+    instead of embedding the transformation configuration, which keeps the representation
+    small when it's sent between processes.
+
+    Args:
+        record: Data of the record submitted to the pipeline
+        failures: Index of the failed transformation, data of the failed record and the error
+
+    Attributes:
+        record: Data of the record submitted to the pipeline
+        failures: Index of the failed transformation, data of the failed record and the error
+
+    """
+
+    __slots__ = ("record", "failures")
+
+    def __init__(
+        self,
+        record: Dict[Any, Any],
+        failures: List[Tuple[int, Dict[Any, Any], Exception]],
+    ) -> None:
+        self.record = record
+        self.failures = failures
+
+
 class FlowPipelineResult:
     """Defines Flow Pipeline Result, this object is return when whole pipeline succeeded, record
     failed to be processed, or pipeline unexpectedly failed. The actual behaviour depends on the
@@ -103,6 +205,31 @@ class FlowPipelineResult:
         self.state = state
 
 
+class FlowPipelineBatchResult:
+    """Defines Flow Pipeline Batch Result, which holds the outcome of processing a batch of
+    records in the same form as the Flow Pipeline Results of the records processed one by one
+
+    Args:
+        datasets: Records of the successfully processed records, by the dataset name
+        failed: States of the records that failed the processing
+
+    Attributes:
+        datasets: Records of the successfully processed records, by the dataset name, in the
+            order of the submitted records
+        failed: States of the records that failed the processing, in the order of the submitted
+            records
+
+    """
+
+    def __init__(
+        self,
+        datasets: Dict[str, List[Record]],
+        failed: List[FlowPipelineState],
+    ) -> None:
+        self.datasets = datasets
+        self.failed = failed
+
+
 class FlowPipeline:
     """Defines Flow Pipeline class which invokes the processing and handles the intermediary
     datasets
@@ -126,6 +253,28 @@ class FlowPipeline:
         self.transformations = transformations
         self.instant_fail = instant_fail
         self.pipeline_id = str(uuid4())
+        logger.debug("Compiling conditions of the flow pipeline: %s", self.pipeline_id)
+        self._indexes = {id(t.config): i for i, t in enumerate(transformations)}
+        for transformation in transformations:
+            transformation.warm_conditions()
+
+    def compact_failure(self, state: FlowPipelineState) -> CompactFailure:
+        """Creates a compact representation of a failed pipeline state
+
+        Args:
+            state: Flow Pipeline State
+
+        Returns:
+            Compact Failure
+
+        """
+        return CompactFailure(
+            state.init_record.data,
+            [
+                (self._indexes[id(x.transformation_configuration)], x.record.data, x.error)
+                for x in state.failed_records
+            ],
+        )
 
     def submit(self, record: Record) -> FlowPipelineResult:
         """Creates a Flow Pipeline State instance and starts the processing
@@ -141,6 +290,61 @@ class FlowPipeline:
         state = FlowPipelineState(self.pipeline_id, record)
         return self._process(state)
 
+    def submit_batch(self, records: List[Record]) -> FlowPipelineBatchResult:
+        """Creates a Flow Pipeline Batch State instance and starts the batch processing
+
+        Each transformation is applied to all records of its input datasets before the next
+        transformation is executed. The result matches the results of the records submitted
+        one by one.
+
+        Args:
+            records: Records to be processed
+
+        Returns:
+            Flow Pipeline Batch Result
+
+        """
+        logger.debug(
+            "Batch of %d records submitted to pipeline id: %s", len(records), self.pipeline_id
+        )
+        state = FlowPipelineBatchState(self.pipeline_id, records)
+        return self._process_batch(state)
+
+    def create_limits(self) -> Dict[int, asyncio.Semaphore]:
+        """Creates concurrency limits of the transformations for an async processing
+
+        Note:
+            Limits have to be created inside of the running event loop
+
+        Returns:
+            Semaphores by the index of the transformation in the pipeline
+
+        """
+        return {
+            i: asyncio.Semaphore(t.config.schema.concurrency)
+            for i, t in enumerate(self.transformations)
+            if t.config.schema.concurrency is not None
+        }
+
+    async def asubmit(
+        self,
+        record: Record,
+        limits: Optional[Dict[int, asyncio.Semaphore]] = None,
+    ) -> FlowPipelineResult:
+        """Creates a Flow Pipeline State instance and starts the async processing
+
+        Args:
+            record: Record to be processed
+            limits: Concurrency limits of the transformations, check ``create_limits``
+
+        Returns:
+            Flow Pipeline Result
+
+        """
+        logger.debug("Record submitted to async pipeline id: %s", self.pipeline_id)
+        state = FlowPipelineState(self.pipeline_id, record)
+        return await self._aprocess(state, limits if limits is not None else {})
+
     def _process(self, state: FlowPipelineState) -> FlowPipelineResult:
         """Invokes controller to handle the execution of transformations and handles the state
         of Flow Pipeline
@@ -156,43 +360,191 @@ class FlowPipeline:
         for transformation in self.transformations:
             logger.debug("Flow pipeline executing: %s", transformation)
             input_datasets = self._get_input_records(state, transformation.config)
+            results = []
             for record in input_datasets:
-                result = Controller.process_record(record, transformation)
-                if isinstance(result, FailedRecord):
+                result = self._handle_result(
+                    state, Controller.process_record(record, transformation)
+                )
+                if result is None:
                     success = False
+                else:
+                    results.append(result)
+            self._handle_output_datasets(
+                state, transformation, results, transformation.config.output_datasets
+            )
+
+        return FlowPipelineResult(success=success, state=state)
+
+    def _process_batch(self, state: FlowPipelineBatchState) -> FlowPipelineBatchResult:
+        """Invokes controller to handle the execution of transformations on batches of records
+        and handles the state of Flow Pipeline
+
+        Args:
+            state: Flow Pipeline Batch State
+
+        Returns:
+            Flow Pipeline Batch Result
+
+        Raises:
+            FlowPipelineInstantFailException: If a transformation failed and instant fail is
+                configured
+
+        """
+        for transformation in self.transformations:
+            logger.debug("Flow pipeline executing batch: %s", transformation)
+            origins: List[int] = []
+            records: List[Record] = []
+            for dataset in transformation.config.input_datasets:
+                dataset_origins, dataset_records = state.get_records(dataset)
+                origins.extend(dataset_origins)
+                records.extend(dataset_records)
+            if not records:
+                continue
+            result_origins = []
+            results = []
+            for origin, result in zip(origins, Controller.process_batch(records, transformation)):
+                if isinstance(result, FailedRecord):
                     if self.instant_fail:
                         logger.error("Instant fail, error: %s", result.error)
                         raise FlowPipelineInstantFailException(str(result.error))
-                    state.add_failed_record(result)
+                    state.add_failed_record(origin, result)
                 else:
-                    self._handle_output_datasets(
-                        state, transformation, result, transformation.config.output_datasets
+                    result_origins.append(origin)
+                    results.append(result)
+            for dataset, condition in zip(
+                transformation.config.output_datasets, transformation.output_conditions
+            ):
+                selected_origins, selected = result_origins, results
+                if condition is not None and results:
+                    checks = condition.check_many(
+                        results, transformation.variables, transformation.path_separator
                     )
-                    # state.add_transformation_result(result, transformation.config.output_datasets)
+                    selected_origins = [x for x, met in zip(result_origins, checks) if met]
+                    selected = [x for x, met in zip(results, checks) if met]
+                state.add_transformation_results(selected_origins, selected, dataset)
+
+        return self._batch_result(state)
+
+    @staticmethod
+    def _batch_result(state: FlowPipelineBatchState) -> FlowPipelineBatchResult:
+        """Creates the batch result, records of each dataset are ordered by the submitted record
+        they originate from and records that failed the processing are left out
+
+        Args:
+            state: Flow Pipeline Batch State
+
+        Returns:
+            Flow Pipeline Batch Result
+
+        """
+        datasets: Dict[str, List[Record]] = {}
+        for name, records in state.dataset.items():
+            origins = state.origins[name]
+            order = sorted(range(len(records)), key=origins.__getitem__)
+            selected = [records[i] for i in order if origins[i] not in state.failed_records]
+            if selected:
+                datasets[name] = selected
+        failed = []
+        for origin in sorted(state.failed_records):
+            failed_state = FlowPipelineState(state.pipeline_id, state.init_records[origin])
+            failed_state.failed_records = state.failed_records[origin]
+            failed.append(failed_state)
+        return FlowPipelineBatchResult(datasets, failed)
+
+    async def _aprocess(
+        self,
+        state: FlowPipelineState,
+        limits: Dict[int, asyncio.Semaphore],
+    ) -> FlowPipelineResult:
+        """Invokes controller to handle the async execution of transformations and handles the
+        state of Flow Pipeline
+
+        Args:
+            state: Flow Pipeline state
+            limits: Concurrency limits of the transformations
+
+        Returns:
+            Flow Pipeline Result
+
+        """
+        success = True
+        for index, transformation in enumerate(self.transformations):
+            logger.debug("Flow pipeline executing: %s", transformation)
+            input_datasets = self._get_input_records(state, transformation.config)
+            results = []
+            for record in input_datasets:
+                limit = limits.get(index)
+                if limit is None:
+                    processed = await Controller.aprocess_record(record, transformation)
+                else:
+                    async with limit:
+                        processed = await Controller.aprocess_record(record, transformation)
+                result = self._handle_result(state, processed)
+                if result is None:
+                    success = False
+                else:
+                    results.append(result)
+            self._handle_output_datasets(
+                state, transformation, results, transformation.config.output_datasets
+            )
 
         return FlowPipelineResult(success=success, state=state)
 
+    def _handle_result(
+        self,
+        state: FlowPipelineState,
+        result: Union[Record, FailedRecord],
+    ) -> Optional[Record]:
+        """Handles the result of a transformation applied to a record
+
+        Args:
+            state: Flow Pipeline state
+            result: Transformed record or failed record
+
+        Returns:
+            Transformed record, None if the transformation failed
+
+        Raises:
+            FlowPipelineInstantFailException: If the transformation failed and instant fail is
+                configured
+
+        """
+        if isinstance(result, FailedRecord):
+            if self.instant_fail:
+                logger.error("Instant fail, error: %s", result.error)
+                raise FlowPipelineInstantFailException(str(result.error))
+            state.add_failed_record(result)
+            return None
+        return result
+
     @staticmethod
     def _handle_output_datasets(
         state: FlowPipelineState,
         transformation: Transformation,
-        result: Record,
+        results: List[Record],
         datasets: List[OutputDataset],
     ) -> None:
-        """Performs condition checks and handles output datasets"""
-        for dataset in datasets:
-            if dataset.condition is not None:
-                condition = Resolver.resolve_condition(dataset.condition, transformation.variables)
-                try:
-                    Condition.check(condition, result)
-                except ConditionNotMetException as c_err:
+        """Performs condition checks and handles output datasets
+
+        Conditions of the output datasets are checked for all records transformed by the
+        transformation at once, see ``Condition.check_many``.
+
+        """
+        for dataset, condition in zip(datasets, transformation.output_conditions):
+            selected = results
+            if condition is not None and results:
+                checks = condition.check_many(
+                    results, transformation.variables, transformation.path_separator
+                )
+                selected = [result for result, met in zip(results, checks) if met]
+                if len(selected) < len(results):
                     logger.debug(
-                        "Output dataset condition not met, dataset: %s, error: %s",
+                        "Output dataset condition not met, dataset: %s, records: %d",
                         dataset.name,
-                        c_err,
+                        len(results) - len(selected),
                     )
-                    continue
-            state.add_transformation_result(result, dataset)
+            for result in selected:
+                state.add_transformation_result(result, dataset)
 
     @staticmethod
     def _get_input_records(
@@ -0,0 +1,109 @@
+"""
+Defines classes and methods related to the ``BatchScheduler``
+"""
+
+import logging
+import math
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BatchScheduler:
+    """Implements Batch Scheduler used in parallel mode
+
+    If the batch size is defined in the flow configuration, records are split into batches of
+    that size. Otherwise, batch sizes follow guided self-scheduling: each batch takes a share
+    of the remaining records proportional to the number of cores, so the batches decrease in
+    size and the skewed records at the end of the input don't leave workers idle. Batches are
+    never smaller than the number of records that can be processed in ``target_batch_time``,
+    based on the cost per record measured by the workers, which keeps the scheduling overhead
+    low for cheap records. When the number of records is not known upfront, batches are sized
+    from the measured cost per record, starting from ``stream_batch_size``.
+
+    Args:
+        cores: Number of cores
+        batch: Batch size flow configuration
+
+    Attributes:
+        cores: Number of cores
+        batch: Batch size flow configuration
+        cost_per_record: Measured processing time of a single record in seconds
+        guided_factor: Number of batches per core that share the remaining records
+        target_batch_time: Minimal desired processing time of a batch in seconds
+        smoothing: Weight of the latest measurement in the cost per record estimate
+        stream_batch_size: Batch size used for inputs of unknown length
+
+    """
+
+    guided_factor = 2
+    target_batch_time = 0.01
+    smoothing = 0.5
+    stream_batch_size = 100
+
+    def __init__(self, cores: int, batch: Optional[int]) -> None:
+        self.cores = cores
+        self.batch = batch
+        self.cost_per_record: Optional[float] = None
+
+    def next_size(self, remaining: Optional[int]) -> int:
+        """Returns the size of the next batch
+
+        Args:
+            remaining: Number of records that are not scheduled yet, None if unknown
+
+        Returns:
+            Batch size
+
+        """
+        if remaining is None:
+            if self.batch is not None:
+                return self.batch
+            if self.cost_per_record is None:
+                return self.stream_batch_size
+            return self._min_size()
+        if self.batch is not None:
+            return min(self.batch, remaining)
+        guided = math.ceil(remaining / (self.guided_factor * self.cores))
+        return min(max(guided, self._min_size()), remaining)
+
+    def plan(self, total: int) -> List[int]:
+        """Splits a number of records into batch sizes
+
+        Args:
+            total: Number of records
+
+        Returns:
+            List of batch sizes
+
+        """
+        sizes = []
+        remaining = total
+        while remaining > 0:
+            size = self.next_size(remaining)
+            sizes.append(size)
+            remaining -= size
+        logger.debug("Scheduled %d records in %d batches", total, len(sizes))
+        return sizes
+
+    def update(self, records: int, busy_time: float) -> None:
+        """Updates the cost per record estimate with a measurement from a worker
+
+        Args:
+            records: Number of processed records
+            busy_time: Time spent processing the records in seconds
+
+        """
+        if records == 0:
+            return
+        cost = busy_time / records
+        if self.cost_per_record is None:
+            self.cost_per_record = cost
+        else:
+            self.cost_per_record += self.smoothing * (cost - self.cost_per_record)
+
+    def _min_size(self) -> int:
+        """Returns minimal batch size based on the measured cost per record"""
+        if not self.cost_per_record:
+            return 1
+        return max(1, math.ceil(self.target_batch_time / self.cost_per_record))
@@ -3,6 +3,7 @@ Defines classes and methods related to the ``FlowSchema``
 """
 
 import logging
+from enum import Enum
 from typing import Dict, Any, Optional, List
 from typing_extensions import Self
 from pydantic import BaseModel, Field, model_validator
@@ -11,6 +12,20 @@ from pytransflow.core.flow.fail_scenario import FlowFailScenarioChoices
 logger = logging.getLogger(__name__)
 
 
+class FlowExecutorChoices(Enum):
+    """Defines Flow Executor Choices"""
+
+    PROCESS = "process"
+    THREAD = "thread"
+
+
+class FlowExecutionChoices(Enum):
+    """Defines Flow Execution Choices"""
+
+    RECORD = "record"
+    BATCH = "batch"
+
+
 class FlowSchema(BaseModel):
     """Defines Flow Schema configuration"""
 
@@ -44,12 +59,45 @@ class FlowSchema(BaseModel):
             "Number of cores which will be used to execute a Flow in multiprocessing mode"
         ),
     )
+    executor: Optional[FlowExecutorChoices] = Field(
+        default=None,
+        title="Executor",
+        description=(
+            "Executor used when the parallel mode is enabled. The 'process' executor runs "
+            "pipelines in a multiprocessing pool, which suits CPU-bound transformations. The "
+            "'thread' executor runs pipelines in a thread pool, which avoids pickling and suits "
+            "I/O-bound transformations or transformations that release the GIL. Defaults to "
+            "'process'"
+        ),
+    )
     batch: Optional[int] = Field(
         default=None,
         title="Batch size",
         description=(
             "Batch size i.e. number of records that will be processed in a single process when "
-            "the multiprocessing mode is enabled"
+            "the multiprocessing mode is enabled. If not set, batch sizes are scheduled "
+            "adaptively based on the number of cores and the measured cost per record"
+        ),
+    )
+    preserve_order: bool = Field(
+        default=True,
+        title="Preserve order",
+        description=(
+            "If enabled, results of the multiprocessing mode are merged in the order of the "
+            "input records. Otherwise, results are merged as soon as a batch is processed, "
+            "which trades the ordering of the datasets for throughput"
+        ),
+    )
+    execution: FlowExecutionChoices = Field(
+        default=FlowExecutionChoices.RECORD,
+        title="Execution",
+        description=(
+            "Execution engine of the flow pipeline. The 'record' engine runs each record through "
+            "all transformations before moving to the next record. The 'batch' engine runs each "
+            "transformation over all records of its input datasets before moving to the next "
+            "transformation, which lets transformations process records in batches, see "
+            "'Transformation.transform_batch'. In parallel mode, the engine is applied to each "
+            "batch. Async processing always runs record by record. Defaults to 'record'"
         ),
     )
     variables: Optional[Dict[str, Any]] = Field(
@@ -86,6 +134,8 @@ class FlowSchema(BaseModel):
             raise ValueError("Cores parameter cannot be set if 'parallel' is not set to 'True'")
         if not self.parallel and self.batch is not None:
             raise ValueError("Batch parameter cannot be set if 'parallel' is not set to 'True'")
+        if not self.parallel and self.executor is not None:
+            raise ValueError("Executor parameter cannot be set if 'parallel' is not set to 'True'")
         if self.parallel:
             if self.cores is not None and self.cores <= 0:
                 raise ValueError("Cores parameter has to be greater than 0")
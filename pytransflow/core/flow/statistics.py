@@ -2,40 +2,104 @@
 Defines classes and methods related to the ``FlowStatistics``
 """
 
+from typing import Dict, List
 from pytransflow.core.flow.dataset import Datasets
 
 
-class FlowStatistics:
+class FlowStatistics:  # pylint: disable=too-many-instance-attributes
     """Gathers and calculates flow statistics
 
+    Statistics are either gathered from the flow datasets once the processing is done, or
+    incrementally, record by record, when the flow is processed as a stream.
+
     Args:
         datasets: Flow datasets
 
     Attributes:
         datasets: Flow datasets
+        dataset_names: Names of the output datasets
         number_of_input_records: Number of input records
         number_of_output_datasets: Number of output records
         number_of_failed_records: Number of failed records
         percentage_of_failed_records: Percentage of failed records
+        batch_sizes: Sizes of the batches scheduled in parallel mode
+        worker_busy_time: Time each worker process or thread spent processing batches, in seconds
 
     """
 
     def __init__(self, datasets: Datasets) -> None:
         self.datasets = datasets
+        self.dataset_names: List[str] = []
         self.number_of_input_records = 0
         self.number_of_output_datasets = 0
         self.number_of_failed_records = 0
         self.percentage_of_failed_records = 0
+        self.batch_sizes: List[int] = []
+        self.worker_busy_time: Dict[int, float] = {}
 
     def before_processing(self) -> None:
         """Gathers statistics before processing records"""
         self.number_of_input_records = len(self.datasets.input_records)
+        self.batch_sizes = []
+        self.worker_busy_time = {}
+
+    def add_batch(self, size: int, worker: int, busy_time: float) -> None:
+        """Registers a batch processed in parallel mode
+
+        Args:
+            size: Number of records in the batch
+            worker: ID of the worker process or thread
+            busy_time: Time the worker spent processing the batch in seconds
+
+        """
+        self.batch_sizes.append(size)
+        self.worker_busy_time[worker] = self.worker_busy_time.get(worker, 0.0) + busy_time
 
     def after_processing(self) -> None:
         """Gathers statistics after processing records"""
-        datasets = self.datasets.get_dataset_names()
-        self.number_of_output_datasets = len(datasets)
+        self.dataset_names = self.datasets.get_dataset_names()
+        self.number_of_output_datasets = len(self.dataset_names)
         self.number_of_failed_records = len(self.datasets.failed_records)
+        self._calculate_percentage()
+
+    def start_stream(self) -> None:
+        """Resets statistics before processing a stream of records"""
+        self.dataset_names = []
+        self.number_of_input_records = 0
+        self.number_of_output_datasets = 0
+        self.number_of_failed_records = 0
+        self.percentage_of_failed_records = 0
+        self.batch_sizes = []
+        self.worker_busy_time = {}
+
+    def add_input_record(self) -> None:
+        """Counts a record pulled from the stream"""
+        self.number_of_input_records += 1
+
+    def add_output_record(self, dataset: str) -> None:
+        """Registers a record emitted to an output dataset
+
+        Args:
+            dataset: Dataset name
+
+        """
+        if dataset not in self.dataset_names:
+            self.dataset_names.append(dataset)
+            self.number_of_output_datasets += 1
+
+    def add_failed_record(self) -> None:
+        """Counts a record that failed the processing"""
+        self.number_of_failed_records += 1
+
+    def end_stream(self) -> None:
+        """Calculates statistics once the stream of records is exhausted"""
+        self._calculate_percentage()
+
+    def _calculate_percentage(self) -> None:
+        """Calculates percentage of failed records"""
+        if self.number_of_input_records == 0:
+            self.percentage_of_failed_records = 0
+            return
         self.percentage_of_failed_records = round(
             (self.number_of_failed_records / self.number_of_input_records) * 100
         )
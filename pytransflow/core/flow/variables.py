@@ -16,10 +16,14 @@ class FlowVariables:
     Args:
         variables: Flow variables configuration value
 
+    Attributes:
+        version: Incremented whenever a variable is set, updated or deleted
+
     """
 
     def __init__(self, variables: Optional[Dict[str, Any]] = None) -> None:
         self._variables: Dict[str, Any] = variables if variables is not None else {}
+        self.version = 0
 
     def set_variable(self, name: str, value: Any) -> None:
         """Sets new variable
@@ -35,6 +39,7 @@ class FlowVariables:
         if name in self._variables:
             raise FlowVariableAlreadyExistsException(name)
         self._variables[name] = value
+        self.version += 1
 
     def update_variable(self, name: str, value: Any) -> None:
         """Updates existing variable
@@ -47,6 +52,7 @@ class FlowVariables:
         if name not in self._variables:
             raise FlowVariableDoesNotExistException(name)
         self._variables[name] = value
+        self.version += 1
 
     def delete_variable(self, name: str) -> None:
         """Deletes existing variable
@@ -58,6 +64,7 @@ class FlowVariables:
         if name not in self._variables:
             raise FlowVariableDoesNotExistException(name)
         del self._variables[name]
+        self.version += 1
 
     def get_variable(self, name: str) -> Any:
         """Returns existing variable
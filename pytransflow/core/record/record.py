@@ -19,15 +19,27 @@ class Record:
     This class is used to store record data and it implements some of the
     dictionary functionality
 
+    Args:
+        data: Record data
+        path_separator: Record path separator, defaults to the Transflow configuration
+
     Attributes:
         data: Record data
         path_separator: Record path separator
 
     """
 
-    def __init__(self, data: Optional[Dict[Any, Any]] = None) -> None:
+    def __init__(
+        self,
+        data: Optional[Dict[Any, Any]] = None,
+        path_separator: Optional[str] = None,
+    ) -> None:
         self.data = data if data else {}
-        self.path_separator = TransflowConfiguration().path_separator
+        self.path_separator = (
+            path_separator
+            if path_separator is not None
+            else TransflowConfiguration().path_separator
+        )
 
     def __repr__(self) -> str:
         return repr(self.data)
@@ -12,35 +12,42 @@ class Resolver:
     """Implements methods for resolving dynamic configuration"""
 
     @staticmethod
-    def resolve_condition(expression: str, variables: Optional[FlowVariables]) -> str:
+    def resolve_condition(
+        expression: str,
+        variables: Optional[FlowVariables],
+        path_separator: Optional[str] = None,
+    ) -> str:
         """Resolves conditions for record fields and flow variables
 
         Args:
             expression: Expression
             variables: Flow Variables
+            path_separator: Path separator, defaults to the Transflow configuration
 
         Returns:
             Resolved expression
 
         """
-        expression = Resolver.resolve_field_records(expression)
+        expression = Resolver.resolve_field_records(expression, path_separator)
         if variables is not None:
             expression = Resolver.resolve_flow_variables(expression, variables)
         return expression
 
     @staticmethod
-    def resolve_field_records(expression: str) -> str:
+    def resolve_field_records(expression: str, path_separator: Optional[str] = None) -> str:
         """Resolves expression field record variable names
 
         Args:
             expression: Expression
+            path_separator: Path separator, defaults to the Transflow configuration
 
         Returns:
             Resolved expression
 
         """
         result = expression
-        path_separator = TransflowConfiguration().path_separator
+        if path_separator is None:
+            path_separator = TransflowConfiguration().path_separator
         regex = re.compile(r"(\@[\w" + re.escape(path_separator) + r"]+)")
         for match in re.findall(regex, expression):
             match = match.replace("@", "")
@@ -6,7 +6,11 @@ from pytransflow.core.transformation.schema import TransformationSchema, OutputD
 from pytransflow.core.transformation.configuration import TransformationConfiguration
 from pytransflow.core.transformation.catalogue import TransformationCatalogue
 from pytransflow.core.transformation.transformation import Transformation
-from pytransflow.core.transformation.exception_handler import ExceptionHandler
+from pytransflow.core.transformation.async_transformation import AsyncTransformation
+from pytransflow.core.transformation.exception_handler import (
+    ExceptionHandler,
+    AsyncExceptionHandler,
+)
 
 
 __all__ = [
@@ -14,6 +18,8 @@ __all__ = [
     "TransformationCatalogue",
     "TransformationSchema",
     "ExceptionHandler",
+    "AsyncExceptionHandler",
     "Transformation",
+    "AsyncTransformation",
     "OutputDataset",
 ]
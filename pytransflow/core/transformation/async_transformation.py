@@ -0,0 +1,68 @@
+"""
+Defines ``AsyncTransformation`` abstract class
+"""
+
+import asyncio
+import logging
+from abc import abstractmethod
+from pytransflow.core.record import Record
+from pytransflow.core.transformation.transformation import Transformation
+from pytransflow.core.transformation.exception_handler import AsyncExceptionHandler
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTransformation(Transformation):
+    """Implements Async Transformation logic
+
+    This class is a base class for transformations whose ``transform`` is a coroutine, e.g.
+    transformations that call services or databases. In flows processed with
+    ``Flow.aprocess`` records are transformed concurrently on the event loop, up to the
+    ``concurrency`` limit of the transformation. In flows processed synchronously each record
+    is transformed in its own event loop.
+
+    Args:
+        config: Transformation Configuration
+
+    """
+
+    def execute(self, record: Record) -> Record:
+        """Executes the coroutine in a new event loop
+
+        Args:
+            record: Record to be processed
+
+        Returns:
+            Record object
+
+        """
+        return asyncio.run(self.aexecute(record))
+
+    @AsyncExceptionHandler()
+    async def aexecute(self, record: Record) -> Record:
+        """Executes abstract coroutine transform with exception handler decorator
+
+        Args:
+            record: Record to be processed
+
+        Returns:
+            Record object
+
+        """
+        return await self.transform(record)
+
+    @abstractmethod
+    async def transform(  # type: ignore[override] # pylint: disable=invalid-overridden-method
+        self,
+        record: Record,
+    ) -> Record:
+        """Transforms initial record
+
+        Args:
+            record: Record to be processed
+
+        Returns:
+            Record object
+
+        """
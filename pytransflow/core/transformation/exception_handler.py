@@ -3,8 +3,9 @@ Defines classes and methods related to ``ExceptionHandler``
 """
 
 import logging
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, Coroutine
 from pytransflow.core.record import Record
+from pytransflow.core.transformation.configuration import TransformationConfiguration
 from pytransflow.exceptions.transformation import TransformationBaseException
 
 logger = logging.getLogger(__name__)
@@ -35,17 +36,61 @@ class ExceptionHandler:
             *args: Any,
             **kwargs: Dict[str, Any],
         ) -> Record:
-            config = args[0].config
             try:
                 return function(*args, **kwargs)
             except TransformationBaseException as err:
-                if err.name not in config.schema.ignore_errors:
-                    logger.error("Error occured while applying transformation: %s", err)
-                    raise err
-                logger.warning(
-                    "Error occured while applying transformation, but it's ignored: %s",
-                    err,
-                )
-                return args[1]  # type: ignore[no-any-return]
+                return self.handle(err, args[0].config, args[1])
+
+        return wrapper
+
+    @staticmethod
+    def handle(
+        err: TransformationBaseException,
+        config: TransformationConfiguration,
+        record: Record,
+    ) -> Record:
+        """Handles an exception raised from a transformation
+
+        Args:
+            err: Raised exception
+            config: Transformation configuration
+            record: Record that was processed
+
+        Returns:
+            Record, if the exception is in `ignore_errors`
+
+        Raises:
+            TransformationBaseError: If the exception is not in `ignore_errors`
+
+        """
+        if err.name not in config.schema.ignore_errors:
+            logger.error("Error occured while applying transformation: %s", err)
+            raise err
+        logger.warning(
+            "Error occured while applying transformation, but it's ignored: %s",
+            err,
+        )
+        return record
+
+
+class AsyncExceptionHandler:
+    """Implements Exception Handler for coroutines of async transformations
+
+    Exceptions are handled in the same way as in ``ExceptionHandler``
+
+    """
+
+    def __call__(
+        self,
+        function: Callable[[Any, Record], Coroutine[Any, Any, Record]],
+    ) -> Callable[[Any, Record], Coroutine[Any, Any, Record]]:
+        async def wrapper(
+            *args: Any,
+            **kwargs: Dict[str, Any],
+        ) -> Record:
+            try:
+                return await function(*args, **kwargs)
+            except TransformationBaseException as err:
+                return ExceptionHandler.handle(err, args[0].config, args[1])
 
         return wrapper
@@ -96,6 +96,15 @@ class TransformationSchema(BaseModel):
             "Transformation will be applied, otherwise it will be skipped"
         ),
     )
+    concurrency: Optional[int] = Field(
+        default=None,
+        title="Concurrency",
+        description=(
+            "Maximum number of records processed by the Transformation at the same time when "
+            "the flow is processed asynchronously. Not limited if not set"
+        ),
+        gt=0,
+    )
     required_in_record: List[str] = Field(
         default=[],
         title="Required fields in a Record",
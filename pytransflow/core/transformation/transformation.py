@@ -2,13 +2,16 @@
 Defines ``Transformation`` abstract class
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Union
 from pytransflow.core.record import Record
+from pytransflow.core.condition import CompiledCondition
 from pytransflow.core.flow.variables import FlowVariables
 from pytransflow.core.transformation.configuration import TransformationConfiguration
 from pytransflow.core.transformation.exception_handler import ExceptionHandler
+from pytransflow.exceptions import TransformationBaseException
 
 
 logger = logging.getLogger(__name__)
@@ -20,22 +23,58 @@ class Transformation(ABC):
     This class is a base class for all transformations and implements methods
     that are generic for all transformations.
 
+    When the flow is processed asynchronously, transformations run directly on the event
+    loop. Transformations that block for a long time, e.g. because of I/O, should set
+    ``blocking`` to True, so they are executed in the default executor of the event loop.
+
+    When the flow is executed in the batch mode, transformations are applied to batches of
+    records through ``transform_batch``, which transforms the records one by one unless the
+    transformation provides a native batch implementation.
+
     Args:
         config: Transformation Configuration
 
     Attributes:
         config: Transformation configuration defined in a flow
         variables: Flow variables
+        path_separator: Flow level path separator, defaults to the Transflow configuration
+        condition: Compiled transformation condition
+        output_conditions: Compiled conditions of the output datasets
+        blocking: If True the transformation is executed outside of the event loop in async flows
 
     """
 
+    blocking = False
+
     def __init__(self, config: TransformationConfiguration) -> None:
         self.config = config
         self.variables: Optional[FlowVariables] = None
+        self.path_separator: Optional[str] = None
+        self.condition = self._compile(config.schema.condition)
+        self.output_conditions = [self._compile(x.condition) for x in config.output_datasets]
 
     def __repr__(self) -> str:
         return f"{self.config.schema.__class__.__name__}({self.config})"
 
+    def warm_conditions(self) -> None:
+        """Resolves and parses the conditions of the transformation ahead of time"""
+        for condition in [self.condition, *self.output_conditions]:
+            if condition is not None:
+                condition.warm(self.variables, self.path_separator)
+
+    @staticmethod
+    def _compile(condition: Optional[str]) -> Optional[CompiledCondition]:
+        """Creates compiled condition if the condition is defined
+
+        Args:
+            condition: Condition expression
+
+        Returns:
+            Compiled condition
+
+        """
+        return CompiledCondition(condition) if condition is not None else None
+
     @ExceptionHandler()
     def execute(self, record: Record) -> Record:
         """Executes abstract method transform with exception handler decorator
@@ -49,6 +88,48 @@ class Transformation(ABC):
         """
         return self.transform(record)
 
+    def execute_batch(
+        self,
+        records: List[Record],
+    ) -> List[Union[Record, TransformationBaseException]]:
+        """Executes transform_batch, or transforms the records one by one if the transformation
+        doesn't implement it or the batch fails
+
+        Args:
+            records: Records to be processed
+
+        Returns:
+            For each record, the transformed record or the exception raised while transforming it
+
+        """
+        if type(self).transform_batch is not Transformation.transform_batch:
+            try:
+                return list(self.transform_batch(records))
+            except TransformationBaseException as err:
+                logger.debug("Batch failed, transforming records one by one, error: %s", err)
+        results: List[Union[Record, TransformationBaseException]] = []
+        for record in records:
+            try:
+                results.append(self.execute(record))
+            except TransformationBaseException as err:
+                results.append(err)
+        return results
+
+    async def aexecute(self, record: Record) -> Record:
+        """Executes the transformation in an async flow
+
+        Args:
+            record: Record to be processed
+
+        Returns:
+            Record object
+
+        """
+        if self.blocking:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.execute, record)
+        return self.execute(record)
+
     @abstractmethod
     def transform(
         self,
@@ -63,3 +144,23 @@ class Transformation(ABC):
             Record object
 
         """
+
+    def transform_batch(
+        self,
+        records: List[Record],
+    ) -> List[Record]:
+        """Transforms a batch of records
+
+        The default implementation transforms the records one by one. A native implementation
+        has to check the whole batch before it changes any of the records, so if it raises an
+        exception, the records can be transformed one by one and the error is attributed to the
+        record that caused it.
+
+        Args:
+            records: Records to be processed
+
+        Returns:
+            Transformed records, in the order of the input records
+
+        """
+        return [self.transform(record) for record in records]
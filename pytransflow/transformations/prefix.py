@@ -3,7 +3,7 @@ Defines classes and methods related to ``Prefix`` transformation
 """
 
 import logging
-from typing import Optional
+from typing import List, Optional
 from typing_extensions import Self
 from pydantic import Field, model_validator
 from pytransflow.exceptions import FieldWrongTypeException
@@ -56,6 +56,9 @@ class PrefixTransformation(Transformation):
     Prefix Transformation transforms a record by appending a prefix value to
     the field already present in the record.
 
+    In the batch mode, types of all values are checked before the prefix is added to any
+    of the records.
+
     """
 
     def transform(
@@ -80,3 +83,26 @@ class PrefixTransformation(Transformation):
             record.remove(field)
 
         return record
+
+    def transform_batch(
+        self,
+        records: List[Record],
+    ) -> List[Record]:
+        logger.debug("Applying batch transformation: Prefix, records: %d", len(records))
+        output_field = self.config.schema.output
+        field = self.config.schema.field
+        prefix_value = self.config.schema.value
+        remove_field = not self.config.schema.keep_original and field != output_field
+
+        values = [record[field] for record in records]
+        for value in values:
+            if not isinstance(value, str):
+                logger.warning("Field wrong type: %s", type(value))
+                raise FieldWrongTypeException(field, type(value), "str")
+
+        for record, value in zip(records, values):
+            record[output_field] = prefix_value + value
+            if remove_field:
+                record.remove(field)
+
+        return records
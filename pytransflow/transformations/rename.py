@@ -3,6 +3,7 @@ Defines classes and methods related to ``Rename`` transformation
 """
 
 import logging
+from typing import List
 from typing_extensions import Self
 from pydantic import Field, model_validator
 from pytransflow.core.record import Record
@@ -55,3 +56,18 @@ class RenameTransformation(Transformation):
         record[output_field] = value
 
         return record
+
+    def transform_batch(
+        self,
+        records: List[Record],
+    ) -> List[Record]:
+        logger.debug("Applying batch transformation: Rename, records: %d", len(records))
+        field = self.config.schema.field
+        output_field = self.config.schema.output
+        for record in records:
+            record.remove(output_field, False)
+            value = record[field]
+            record.remove(field)
+            record[output_field] = value
+
+        return records
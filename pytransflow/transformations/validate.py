@@ -47,6 +47,6 @@ class ValidateTransformation(Transformation):
         logger.debug("Applying transformation: Validate")
         schema_class = SchemaLoader.load(self.config.schema.schema_name)
         try:
-            return Record(schema_class(**record.data).model_dump())
+            return Record(schema_class(**record.data).model_dump(), record.path_separator)
         except ValidationError as error:
             raise SchemaValidationException(str(error)) from error
@@ -0,0 +1,110 @@
+"""
+Benchmarks of the parallel flow execution
+
+Run with ``python -m scripts.benchmark`` from the root of the repository.
+"""
+
+import os
+import pickle
+import tempfile
+import time
+from multiprocessing import Event
+from multiprocessing.pool import Pool
+from typing import Any, Dict, List
+
+WORKDIR = tempfile.mkdtemp()
+os.makedirs(os.path.join(WORKDIR, "schemas"))
+os.makedirs(os.path.join(WORKDIR, "flows"))
+os.chdir(WORKDIR)
+
+# pylint: disable=wrong-import-position
+from pytransflow.core.flow import Flow
+from pytransflow.core.flow.configuration import FlowConfiguration
+from pytransflow.core.flow.schema import FlowSchema
+from pytransflow.core.flow.pipeline import FlowPipeline, FlowPipelineResult
+from pytransflow.core.flow.parallel import (
+    initialize_worker,
+    process_batch,
+)
+from pytransflow.core.record import Record
+from pytransflow.core.transformation import Transformation
+
+CONFIG: Dict[str, Any] = {
+    "parallel": True,
+    "transformations": [
+        {"add_field": {"name": "a", "value": "b"}},
+        {"prefix": {"field": "a", "value": "p_"}},
+        {"postfix": {"field": "a", "value": "_s"}},
+        {"rename": {"field": "a", "output": "b", "condition": "@b != 'x'"}},
+        {"add_field": {"name": "c/d", "value": {"e": "f"}}},
+        {"remove_fields": {"fields": ["c/d/e"]}},
+    ],
+}
+
+
+def legacy_process_batch(
+    records: List[Record],
+    transformations: List[Transformation],
+    instant_fail: bool,
+) -> List[FlowPipelineResult]:
+    """Processing task that receives the whole pipeline with every batch"""
+    pipeline = FlowPipeline(transformations, instant_fail)
+    return [pipeline.submit(record) for record in records]
+
+
+def _batches(number: int, size: int) -> List[List[Record]]:
+    return [[Record({"i": i, "j": str(i)}) for i in range(size)] for _ in range(number)]
+
+
+def parallel_initializer(batches: int = 2000, batch_size: int = 5, cores: int = 2) -> None:
+    """Compares shipping the pipeline with every task against the pool initializer"""
+    config = FlowConfiguration(FlowSchema(**CONFIG))
+    transformations = config.transformations
+    sample = _batches(1, batch_size)[0]
+
+    legacy_bytes = len(pickle.dumps((sample, transformations, False)))
+    task_bytes = len(pickle.dumps((sample,)))
+    print(f"Pickled bytes per task, batch of {batch_size} records")
+    print(f"  pipeline per task: {legacy_bytes}")
+    print(f"  pool initializer:  {task_bytes}")
+
+    with Pool(cores) as pool:
+        start = time.perf_counter()
+        tasks = [
+            pool.apply_async(legacy_process_batch, (batch, transformations, False))
+            for batch in _batches(batches, batch_size)
+        ]
+        for task in tasks:
+            task.get()
+        legacy_time = time.perf_counter() - start
+
+    with Pool(
+        cores, initializer=initialize_worker, initargs=(transformations, False, Event())
+    ) as pool:
+        start = time.perf_counter()
+        tasks = [
+            pool.apply_async(process_batch, (batch,)) for batch in _batches(batches, batch_size)
+        ]
+        for task in tasks:
+            task.get()
+        task_time = time.perf_counter() - start
+
+    print(f"Wall time, {batches} batches of {batch_size} records on {cores} cores")
+    print(f"  pipeline per task: {legacy_time:.3f}s")
+    print(f"  pool initializer:  {task_time:.3f}s")
+
+
+def parallel_executors(records: int = 20000, cores: int = 2) -> None:
+    """Compares the process and thread executors of the parallel mode"""
+    data = [{"i": i, "j": str(i)} for i in range(records)]
+    print(f"Wall time, {records} records on {cores} cores")
+    for executor in ("process", "thread"):
+        with Flow(config={**CONFIG, "executor": executor, "cores": cores}) as flow:
+            start = time.perf_counter()
+            flow.process(data)
+            print(f"  {executor} executor: {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    parallel_initializer()
+    parallel_executors()
@@ -0,0 +1,250 @@
+import pickle
+import pytest
+from unittest.mock import patch
+from pytransflow.core.condition import (
+    Condition,
+    CompiledCondition,
+    ConditionCompiler,
+    ConditionVectorizer,
+)
+from pytransflow.core.eval import SimpleEval
+from pytransflow.core.flow.variables import FlowVariables
+from pytransflow.core.record import Record
+from pytransflow.core.resolver import Resolver
+from pytransflow.exceptions import ConditionNotMetException
+
+
+def test_compiled_condition_compiles_once():
+    condition = CompiledCondition("@a/b == 1")
+    with patch.object(
+        Resolver, "resolve_condition", wraps=Resolver.resolve_condition
+    ) as resolve:
+        assert condition.check(Record({"a": {"b": 1}}))
+        assert condition.check(Record({"a": {"b": 1}}))
+        with pytest.raises(ConditionNotMetException):
+            condition.check(Record({"a": {"b": 2}}))
+    assert resolve.call_count == 1
+
+
+def test_compiled_condition_path_separator():
+    condition = CompiledCondition("@a.b == 1")
+    assert condition.check(Record({"a": {"b": 1}}), path_separator=".")
+    assert condition.compile(path_separator=".")[0] == "record['a']['b'] == 1"
+
+
+def test_compiled_condition_variables_changed():
+    variables = FlowVariables({"x": 1})
+    condition = CompiledCondition("@a == !:x")
+    assert condition.check(Record({"a": 1}), variables)
+
+    variables.update_variable("x", 2)
+    with pytest.raises(ConditionNotMetException):
+        condition.check(Record({"a": 1}), variables)
+    assert condition.check(Record({"a": 2}), variables)
+
+
+def test_compiled_condition_warm_not_compilable():
+    condition = CompiledCondition("@a == !:x")
+    condition.warm(FlowVariables())
+    assert condition._compiled is None
+
+    condition = CompiledCondition("@a == !:x")
+    condition.warm(FlowVariables({"x": 1}))
+    assert condition._compiled is not None
+
+
+def test_compiled_condition_pickle():
+    condition = CompiledCondition("@a == 1")
+    condition.warm()
+    restored = pickle.loads(pickle.dumps(condition))
+
+    assert restored.condition == "@a == 1"
+    assert restored._compiled is None
+    assert restored.check(Record({"a": 1}))
+
+
+def test_condition_custom_function_added():
+    assert Condition.check("record['a'] == 1", Record({"a": 1}))
+    SimpleEval.add_function("triple", lambda x: x * 3)
+    assert Condition.check("triple(record['a']) == 3", Record({"a": 1}))
+
+
+def test_condition_syntax_error():
+    with pytest.raises(RuntimeError, match="Condition syntax '1 =~ 2' is not defined properly"):
+        Condition.check("1 =~ 2", Record({}))
+
+
+RECORDS = [
+    {},
+    {"a": 1, "b": "x", "c": {"d": [1, 2], "e": None}},
+    {"a": 150, "b": "active", "c": {"d": 3}},
+    {"a": "1", "b": 2, "c": "d"},
+    {"a": 0, "b": "", "c": {"d": {"e": 5}}},
+]
+
+EXPRESSIONS = [
+    "record['a'] == 1",
+    "record['b'] == 'active' and record['a'] > 100",
+    "record['a'] > 100 or record['b'] == 'x'",
+    "record['a'] and record['b'] and record['c']",
+    "not record['a']",
+    "-record['a'] < 0",
+    "record['a'] + 1 == 2",
+    "record['a'] * 2 - 1 > 0",
+    "record['a'] / 2 >= 0.5",
+    "record['a'] // 2 % 2 == 0",
+    "record['a'] ** 2 != 1",
+    "0 < record['a'] < 200",
+    "0 < record['a'] > 200",
+    "'x' in record['b']",
+    "'x' not in record['b']",
+    "'c' in record",
+    "record['c']['d'] == 3",
+    "record['c']['d']['e'] == 5",
+    "record['c']['e'] is None",
+    "record['c']['e'] is not None",
+    "record['c']['d'][0] == 1",
+    "record['c']['d'][record['a']] == 2",
+    "int(record['a']) == 1",
+    "str(record['a']) == '1'",
+    "'yes' if record['a'] else ''",
+    "record['a'] & 1",
+    "~record['a'] == -2",
+    "record['a'] == True",
+    "record['c']['d'][0:1]",
+    "record['missing'] == 1",
+    "record.a == 1",
+    "unknown == 1",
+    "unknown(record['a'])",
+    "float(x=1) == 1",
+    "record['a'] in [1, 2]",
+    "record['a'] @ record['a']",
+    "record['a'] / 0 == 1",
+]
+
+
+def _outcome(function):
+    try:
+        return ("result", function())
+    except Exception as err:
+        return ("error", type(err))
+
+
+def test_condition_compiler_matches_simpleeval():
+    compiled = 0
+    for expression in EXPRESSIONS:
+        parsed = Condition.parse(expression)
+        predicate = ConditionCompiler.compile(parsed)
+        compiled += predicate is not None
+        for data in RECORDS:
+            record = Record(data)
+            expected = _outcome(lambda: Condition.check(expression, record, parsed))
+            actual = _outcome(lambda: Condition.check(expression, record, parsed, predicate))
+            assert actual == expected, (expression, data)
+    assert compiled == len(EXPRESSIONS) - 7
+
+
+def test_condition_compiler_fallback():
+    assert ConditionCompiler.compile(Condition.parse("record.a")) is None
+    assert ConditionCompiler.compile(Condition.parse("'" + "a" * 200000 + "'")) is None
+    assert ConditionCompiler.compile(Condition.parse("record['a'] == 1")) is not None
+
+
+def test_compiled_condition_uses_predicate():
+    condition = CompiledCondition("@a == 1 and @b/c > 2")
+    with patch.object(Condition, "_evaluate") as evaluate:
+        assert condition.check(Record({"a": 1, "b": {"c": 3}}))
+        with pytest.raises(ConditionNotMetException):
+            condition.check(Record({"a": 1}))
+    evaluate.assert_not_called()
+
+
+def _check_outcome(expression, record):
+    try:
+        return Condition.check(expression, record)
+    except ConditionNotMetException:
+        return False
+
+
+def test_check_many_matches_check():
+    for expression in EXPRESSIONS:
+        records = [Record(data) for data in RECORDS]
+        expected = [_outcome(lambda: _check_outcome(expression, x)) for x in records]
+        errors = [x for x in expected if x[0] == "error"]
+        actual = _outcome(lambda: Condition.check_many(expression, records))
+        if errors:
+            assert actual == errors[0], expression
+        else:
+            assert actual == ("result", [x[1] for x in expected]), expression
+
+
+def test_check_many_syntax_error():
+    with pytest.raises(RuntimeError, match="Condition syntax '1 =~ 2' is not defined properly"):
+        Condition.check_many("1 =~ 2", [Record({})])
+
+
+VECTORIZED_RECORDS = [
+    {"a": i, "b": ["active", "inactive", "x"][i % 3], "c": i / 3}
+    for i in range(40)
+] + [{}, {"b": "active"}, {"a": 150}, {"a": 2**53, "b": ""}]
+
+VECTORIZED_EXPRESSIONS = [
+    "record['a'] == 3",
+    "record['a'] != 3",
+    "record['a'] > 10",
+    "10 > record['a']",
+    "record['c'] <= 2.5",
+    "2.5 >= record['c']",
+    "record['a'] >= 150 or record['b'] == 'active'",
+    "record['b'] == 'active' and record['a'] > 20",
+    "record['b'] < 'b' and record['a'] > 20 or record['c'] < 1",
+    "not record['a'] < 20",
+    "not (record['a'] < 20 or record['b'] == 'x')",
+]
+
+
+def test_check_many_vectorized():
+    pytest.importorskip("numpy")
+    records = [Record(data) for data in VECTORIZED_RECORDS]
+    for expression in VECTORIZED_EXPRESSIONS:
+        vectorized = ConditionVectorizer.vectorize(Condition.parse(expression))
+        assert vectorized is not None, expression
+        expected = [_check_outcome(expression, x) for x in records]
+        assert vectorized(records) == expected, expression
+        assert Condition.check_many(expression, records) == expected, expression
+        assert Condition.check_many(expression, records * 20) == expected * 20, expression
+
+
+def test_check_many_not_vectorizable():
+    pytest.importorskip("numpy")
+    for expression in [
+        "record['a'] + 1 > 3",
+        "record['a'] < 3 < 5",
+        "record['a'] in 'abc'",
+        "record['c']['d'] == 3",
+        "record[record['b']] == 3",
+        "record['a'] == True",
+        "record['a'] == 'a\\0'",
+        "record['a'] == 9007199254740993",
+    ]:
+        assert ConditionVectorizer.vectorize(Condition.parse(expression)) is None, expression
+
+    vectorized = ConditionVectorizer.vectorize(Condition.parse("record['a'] > 1"))
+    for data in [{"a": "2"}, {"a": True}, {"a": 2**60}]:
+        records = [Record({"a": 2})] * 40 + [Record(data)]
+        assert vectorized(records) is None
+        assert Condition.check_many("record['a'] > 1", records) == [True] * 40 + [
+            _check_outcome("record['a'] > 1", Record(data))
+        ]
+    vectorized = ConditionVectorizer.vectorize(Condition.parse("record['a'] == 'x'"))
+    assert vectorized([Record({"a": "x"}), Record({"a": 1})]) is None
+    assert vectorized([Record({"a": "x"}), Record({"a": "x\0"})]) is None
+
+
+def test_compiled_condition_check_many():
+    condition = CompiledCondition("@a/b == !:x")
+    variables = FlowVariables({"x": 1})
+    records = [Record({"a": {"b": 1}}), Record({"a": {"b": 2}}), Record({})]
+    assert condition.check_many(records, variables) == [True, False, False]
+    variables.update_variable("x", 2)
+    assert condition.check_many(records, variables) == [False, True, False]
@@ -1,10 +1,21 @@
+import asyncio
+import threading
+from copy import deepcopy
 import pytest
 from unittest.mock import patch
-from pydantic import ValidationError
+from typing_extensions import Self
+from pydantic import ValidationError, model_validator
 from pytransflow.core.configuration import TransflowConfiguration
 from pytransflow.core.flow import Flow
 from pytransflow.core.flow.variables import FlowVariables
 from pytransflow.core.flow.dataset import FailedDataset
+from pytransflow.core.record import Record
+from pytransflow.core.transformation import (
+    AsyncTransformation,
+    Transformation,
+    TransformationCatalogue,
+    TransformationSchema,
+)
 from pytransflow.exceptions import (
     OutputAlreadyExistsException,
     FlowFailScenarioException,
@@ -17,6 +28,7 @@ from pytransflow.exceptions import (
     FlowVariableDoesNotExistException,
     FlowVariableAlreadyExistsException,
     SchemaValidationException,
+    FieldWrongTypeException,
 )
 
 
@@ -687,7 +699,15 @@ def test_parallel_misconfigured():
             },
             "1 validation error for FlowSchema\n  Value error, Cores parameter "
             "has to be greater than 0 .*"
-        )
+        ),
+        (
+           {
+                "executor": "thread",
+                "transformations": []
+            },
+            "1 validation error for FlowSchema\n  Value error, Executor parameter cannot be "
+            "set if 'parallel' is not set to 'True' .*'"
+        ),
     ]
     for config, error in configs:
         with pytest.raises(
@@ -716,7 +736,7 @@ def test_flow_path_separator_config():
 
     assert dataset == {"default": [{"a": {"b": "c"}}]}
     assert failed_records == []
-    TransflowConfiguration().path_separator = "/"
+    assert TransflowConfiguration().path_separator == "/"
 
 
 def test_flow_variables():
@@ -773,3 +793,643 @@ def test_cpu_count_none(mock):
         match="Cannot determine number of available cores",
     ):
         flow.process([{}])
+
+
+def test_process_iter():
+    config = {
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                    "output_datasets": [
+                        {"x": "@c == 1"},
+                        "y",
+                    ]
+                }
+            }
+        ]
+    }
+    flow = Flow(config=config)
+    events = list(flow.process_iter(iter([{"c": 1}, {"c": 2}, {"a": "c"}])))
+
+    assert events[:3] == [
+        ("x", {"a": "b", "c": 1}),
+        ("y", {"a": "b", "c": 1}),
+        ("y", {"a": "b", "c": 2}),
+    ]
+    name, failed = events[3]
+    assert name is None
+    assert isinstance(failed, FailedDataset)
+    assert failed.record == {"a": "c"}
+    assert flow.datasets == {}
+    assert flow.statistics.number_of_input_records == 3
+    assert flow.statistics.number_of_output_datasets == 2
+    assert flow.statistics.number_of_failed_records == 1
+    assert flow.statistics.percentage_of_failed_records == 33
+
+
+def test_process_iter_lazy():
+    config = {
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                }
+            }
+        ]
+    }
+    pulled = []
+
+    def records():
+        for i in range(3):
+            pulled.append(i)
+            yield {"i": i}
+
+    flow = Flow(config=config)
+    events = flow.process_iter(records())
+    assert next(events) == ("default", {"i": 0, "a": "b"})
+    assert pulled == [0]
+
+
+def test_process_iter_empty():
+    flow = Flow(config={"transformations": []})
+    assert list(flow.process_iter([])) == []
+    assert flow.statistics.percentage_of_failed_records == 0
+
+
+def test_process_iter_fail_scenario():
+    config = {
+        "fail_scenarios": {
+            "datasets_not_present": ["b"],
+        },
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                }
+            }
+        ]
+    }
+    flow = Flow(config=config)
+    events = flow.process_iter([{}])
+    assert next(events) == ("default", {"a": "b"})
+    with pytest.raises(
+        FlowFailScenarioException,
+        match="Flow Fail Scenario 'datasets_not_present': Dataset 'b' is not present"
+    ):
+        next(events)
+
+
+def test_process_iter_instant_fail():
+    config = {
+        "instant_fail": True,
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                }
+            }
+        ]
+    }
+    flow = Flow(config=config)
+    with pytest.raises(FlowInstantFailException):
+        list(flow.process_iter([{"a": "b"}]))
+
+
+def test_parallel_pool_reused():
+    config = {
+        "parallel": True,
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                },
+            },
+        ]
+    }
+    with Flow(config=config) as flow:
+        flow.process([{}])
+        pool = flow._parallel._pool
+        flow.process([{"c": "d"}, {}])
+        assert flow._parallel._pool is pool
+        assert flow.datasets == {"default": [{"a": "b"}, {"c": "d", "a": "b"}, {"a": "b"}]}
+    assert flow._parallel is None
+    flow.close()
+
+
+def test_parallel_statistics():
+    config = {
+        "parallel": True,
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                },
+            },
+        ]
+    }
+    records = [{"i": i} for i in range(10)]
+    with Flow(config=config) as flow:
+        flow.process(records)
+        assert sum(flow.statistics.batch_sizes) == 10
+        assert len(flow.statistics.batch_sizes) > 1
+        assert len(flow.statistics.worker_busy_time) >= 1
+        assert flow.datasets == {"default": [{"i": i, "a": "b"} for i in range(10)]}
+
+
+def test_parallel_unordered():
+    config = {
+        "parallel": True,
+        "preserve_order": False,
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                },
+            },
+        ]
+    }
+    records = [{"i": i} for i in range(50)]
+    with Flow(config=config) as flow:
+        flow.process(records)
+        dataset = flow.datasets["default"]
+    assert sorted(dataset, key=lambda x: x["i"]) == [{"i": i, "a": "b"} for i in range(50)]
+
+
+def test_parallel_unordered_failure():
+    config = {
+        "parallel": True,
+        "preserve_order": False,
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                    "condition": "315131 =~ 'D'"
+                },
+            },
+        ]
+    }
+    with Flow(config=config) as flow:
+        with pytest.raises(Exception, match="Condition syntax '315131 =~ 'D'' is not defined properly"):
+            flow.process([{}])
+
+
+def test_process_iter_parallel():
+    config = {
+        "parallel": True,
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                },
+            },
+        ]
+    }
+    records = ({"i": i} for i in range(250))
+    with Flow(config=config) as flow:
+        events = list(flow.process_iter(records))
+        assert flow.statistics.batch_sizes[0] == 100
+    assert events == [("default", {"i": i, "a": "b"}) for i in range(250)]
+    assert flow.statistics.number_of_input_records == 250
+
+
+def test_parallel_instant_fail():
+    config = {
+        "parallel": True,
+        "batch": 1,
+        "instant_fail": True,
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                },
+            },
+        ]
+    }
+    with Flow(config=config) as flow:
+        with pytest.raises(
+            FlowInstantFailException,
+            match="Flow raised instant fail exception",
+        ):
+            flow.process([{}, {"a": "b"}, {}, {}])
+        assert flow._parallel._pool is None
+
+        flow.process([{}])
+        assert flow.datasets["default"][-1] == {"a": "b"}
+
+
+def test_parallel_failed_records():
+    config = {
+        "parallel": True,
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                },
+            },
+        ]
+    }
+    with Flow(config=config) as flow:
+        flow.process([{}, {"a": "c"}])
+        events = list(flow.process_iter([{"a": "d"}, {}]))
+
+    assert flow.datasets == {"default": [{"a": "b"}]}
+    assert len(flow.failed_records) == 1
+    failed_record = flow.failed_records[0]
+    assert failed_record.record == {"a": "c"}
+    assert isinstance(failed_record.failed_records[0].error, OutputAlreadyExistsException)
+
+    assert events[0] == ("default", {"a": "b"})
+    assert events[1][0] is None
+    assert events[1][1].record == {"a": "d"}
+
+
+def test_flow_path_separator_isolated():
+    dot_flow = Flow(
+        config={
+            "path_separator": ".",
+            "transformations": [
+                {"add_field": {"name": "a.b", "value": "c", "condition": "@x.y == 1"}},
+            ]
+        }
+    )
+    slash_flow = Flow(
+        config={
+            "transformations": [
+                {"add_field": {"name": "a/b", "value": "c"}},
+            ]
+        }
+    )
+    dot_flow.process([{"x": {"y": 1}}])
+    slash_flow.process([{}])
+
+    assert TransflowConfiguration().path_separator == "/"
+    assert dot_flow.datasets == {"default": [{"x": {"y": 1}, "a": {"b": "c"}}]}
+    assert slash_flow.datasets == {"default": [{"a": {"b": "c"}}]}
+
+
+def test_parallel_thread_executor():
+    config = {
+        "parallel": True,
+        "executor": "thread",
+        "cores": 4,
+        "path_separator": ".",
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a.b",
+                    "value": "c",
+                    "condition": "@i != 3",
+                },
+            },
+        ]
+    }
+    records = [{"i": i} for i in range(20)]
+    expected = [{"i": i, "a": {"b": "c"}} if i != 3 else {"i": i} for i in range(20)]
+    with Flow(config=config) as flow:
+        flow.process(records)
+        assert flow._parallel.cores == 4
+        assert flow.datasets == {"default": expected}
+        assert sum(flow.statistics.batch_sizes) == 20
+
+        results = list(flow.process_iter(records))
+        assert [record.data for _, record in results] == expected
+    assert TransflowConfiguration().path_separator == "/"
+
+
+def test_parallel_thread_executor_unordered():
+    config = {
+        "parallel": True,
+        "executor": "thread",
+        "preserve_order": False,
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                },
+            },
+        ]
+    }
+    records = [{"i": i} for i in range(50)]
+    with Flow(config=config) as flow:
+        flow.process(records)
+        result = flow.datasets["default"]
+    assert sorted(result, key=lambda x: x["i"]) == [{"i": i, "a": "b"} for i in range(50)]
+
+
+def test_parallel_thread_executor_failures():
+    config = {
+        "parallel": True,
+        "executor": "thread",
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                },
+            },
+        ]
+    }
+    with Flow(config=config) as flow:
+        flow.process([{}, {"a": "c"}])
+        assert flow.datasets == {"default": [{"a": "b"}]}
+        assert len(flow.failed_records) == 1
+        assert flow.failed_records[0].record == {"a": "c"}
+
+
+def test_parallel_thread_executor_instant_fail():
+    config = {
+        "parallel": True,
+        "executor": "thread",
+        "batch": 1,
+        "instant_fail": True,
+        "transformations": [
+            {
+                "add_field": {
+                    "name": "a",
+                    "value": "b",
+                },
+            },
+        ]
+    }
+    with Flow(config=config) as flow:
+        with pytest.raises(
+            FlowInstantFailException,
+            match="Flow raised instant fail exception",
+        ):
+            flow.process([{}, {"a": "b"}, {}, {}])
+        assert flow._parallel._pool is None
+
+        flow.process([{}])
+        assert flow.datasets["default"][-1] == {"a": "b"}
+
+
+class AsyncLookupSchema(TransformationSchema):
+    field: str
+
+    @model_validator(mode="after")
+    def configure(self) -> Self:
+        self.set_dynamic_fields()
+        return self
+
+
+class BlockingSchema(TransformationSchema):
+    @model_validator(mode="after")
+    def configure(self) -> Self:
+        self.set_dynamic_fields()
+        return self
+
+
+class AsyncLookupTransformation(AsyncTransformation):
+    active = 0
+    max_active = 0
+
+    async def transform(self, record: Record) -> Record:
+        cls = AsyncLookupTransformation
+        cls.active += 1
+        cls.max_active = max(cls.max_active, cls.active)
+        await asyncio.sleep(0.01)
+        cls.active -= 1
+        if record["i"] == 3:
+            raise FieldWrongTypeException("i", int, "str")
+        record[self.config.schema.field] = record["i"] * 2
+        return record
+
+
+class BlockingTransformation(Transformation):
+    blocking = True
+
+    def transform(self, record: Record) -> Record:
+        record["thread"] = threading.current_thread() is not threading.main_thread()
+        return record
+
+
+TransformationCatalogue.add_transformation(
+    "async_lookup", AsyncLookupTransformation, AsyncLookupSchema, overwrite=True
+)
+TransformationCatalogue.add_transformation(
+    "blocking", BlockingTransformation, BlockingSchema, overwrite=True
+)
+
+
+def test_aprocess():
+    AsyncLookupTransformation.max_active = 0
+    config = {
+        "transformations": [
+            {"async_lookup": {"field": "j", "concurrency": 3}},
+            {"add_field": {"name": "a", "value": "b", "condition": "@i != 5"}},
+            {"blocking": {}},
+        ]
+    }
+    flow = Flow(config=config)
+    asyncio.run(flow.aprocess([{"i": i} for i in range(10)]))
+
+    assert AsyncLookupTransformation.max_active == 3
+    assert flow.datasets == {
+        "default": [
+            {"i": 5, "j": 10, "thread": True}
+            if i == 5
+            else {"i": i, "j": i * 2, "a": "b", "thread": True}
+            for i in range(10)
+            if i != 3
+        ]
+    }
+    assert len(flow.failed_records) == 1
+    assert flow.failed_records[0].record == {"i": 3}
+    assert isinstance(flow.failed_records[0].failed_records[0].error, FieldWrongTypeException)
+    assert flow.statistics.number_of_input_records == 10
+    assert flow.statistics.number_of_failed_records == 1
+
+
+def test_aprocess_unlimited_and_ignored_errors():
+    AsyncLookupTransformation.max_active = 0
+    config = {
+        "transformations": [
+            {"async_lookup": {"field": "j", "ignore_errors": ["field_wrong_type"]}},
+        ]
+    }
+    flow = Flow(config=config)
+    asyncio.run(flow.aprocess([{"i": i} for i in range(10)]))
+
+    assert AsyncLookupTransformation.max_active == 10
+    assert flow.datasets["default"][3] == {"i": 3}
+    assert flow.failed_records == []
+
+
+def test_async_transformation_in_sync_flow():
+    config = {
+        "transformations": [
+            {"async_lookup": {"field": "j"}},
+        ]
+    }
+    flow = Flow(config=config)
+    flow.process([{"i": 1}, {"i": 3}])
+
+    assert flow.datasets == {"default": [{"i": 1, "j": 2}]}
+    assert len(flow.failed_records) == 1
+
+
+def test_aprocess_instant_fail():
+    config = {
+        "instant_fail": True,
+        "transformations": [
+            {"async_lookup": {"field": "j"}},
+        ]
+    }
+    flow = Flow(config=config)
+    with pytest.raises(
+        FlowInstantFailException,
+        match="Flow raised instant fail exception",
+    ):
+        asyncio.run(flow.aprocess([{"i": i} for i in range(10)]))
+    assert flow.datasets == {}
+
+
+def test_aprocess_failed():
+    config = {
+        "transformations": [
+            {"async_lookup": {"field": "j"}},
+        ]
+    }
+    flow = Flow(config=config)
+    with patch.object(
+        AsyncLookupTransformation, "transform", side_effect=ZeroDivisionError("error")
+    ):
+        with pytest.raises(FlowFailedException):
+            asyncio.run(flow.aprocess([{"i": 1}]))
+
+
+def test_aprocess_concurrency_misconfigured():
+    with pytest.raises(ValueError):
+        Flow(config={"transformations": [{"async_lookup": {"field": "j", "concurrency": 0}}]})
+
+
+BATCH_EXECUTION_CONFIG = {
+    "transformations": [
+        {"prefix": {"field": "a", "value": "p_", "condition": "@i != 2"}},
+        {"rename": {"field": "a", "output": "b", "output_datasets": ["x", "y"]}},
+        {
+            "add_field": {
+                "name": "c",
+                "value": "d",
+                "input_datasets": ["x"],
+                "output_datasets": [{"name": "z", "condition": "@i > 4"}, "w"],
+            }
+        },
+        {"postfix": {"field": "b", "value": "_s", "input_datasets": ["y"]}},
+    ]
+}
+BATCH_EXECUTION_RECORDS = [
+    {"i": 0, "a": "a"},
+    {"i": 1, "a": 1},
+    {"i": 2, "a": "a"},
+    {"i": 3},
+    {"i": 4, "a": "a", "c": "c"},
+    {"i": 5, "a": "a", "b": "b"},
+    {"i": 6, "a": "a"},
+]
+
+
+def _flow_results(config, records):
+    flow = Flow(config=config)
+    flow.process(deepcopy(records))
+    failed = [
+        (x.record.data, [(y.transformation_name, type(y.error)) for y in x.failed_records])
+        for x in flow.failed_records
+    ]
+    statistics = (
+        flow.statistics.number_of_output_datasets,
+        flow.statistics.number_of_failed_records,
+    )
+    return flow.datasets, failed, statistics
+
+
+def test_batch_execution():
+    config = {**BATCH_EXECUTION_CONFIG, "execution": "batch"}
+    datasets, failed, statistics = _flow_results(config, BATCH_EXECUTION_RECORDS)
+
+    assert datasets["z"] == [{"i": 6, "b": "p_a", "c": "d"}]
+    assert [x[0]["i"] for x in failed] == [1, 3, 4, 5]
+    assert failed[0][1] == [("PrefixTransformation", FieldWrongTypeException)]
+    assert (datasets, failed, statistics) == _flow_results(
+        BATCH_EXECUTION_CONFIG, BATCH_EXECUTION_RECORDS
+    )
+
+
+def test_batch_execution_empty():
+    flow = Flow(config={**BATCH_EXECUTION_CONFIG, "execution": "batch"})
+    flow.process([])
+    assert flow.datasets == {}
+    assert flow.failed_records == []
+
+
+def test_batch_execution_instant_fail():
+    config = {**BATCH_EXECUTION_CONFIG, "execution": "batch", "instant_fail": True}
+    flow = Flow(config=config)
+    with pytest.raises(FlowInstantFailException):
+        flow.process(BATCH_EXECUTION_RECORDS)
+    assert flow.datasets == {}
+
+
+def test_batch_execution_process_iter():
+    flow = Flow(config={**BATCH_EXECUTION_CONFIG, "execution": "batch"})
+    flow.stream_batch_size = 3
+    events = list(flow.process_iter(iter(deepcopy(BATCH_EXECUTION_RECORDS))))
+    datasets, failed, _ = _flow_results(BATCH_EXECUTION_CONFIG, BATCH_EXECUTION_RECORDS)
+
+    assert [x.data["i"] for name, x in events if name == "z"] == [6]
+    assert [x.record.data["i"] for name, x in events if name is None] == [x[0]["i"] for x in failed]
+    assert flow.statistics.number_of_input_records == 7
+    assert flow.statistics.number_of_failed_records == 4
+    assert flow.statistics.number_of_output_datasets == len(datasets)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_batch_execution_parallel(executor):
+    config = {
+        **BATCH_EXECUTION_CONFIG,
+        "execution": "batch",
+        "parallel": True,
+        "executor": executor,
+        "cores": 1,
+        "batch": 3,
+    }
+    with Flow(config=config) as flow:
+        flow.process(deepcopy(BATCH_EXECUTION_RECORDS))
+        datasets, failed, _ = _flow_results(BATCH_EXECUTION_CONFIG, BATCH_EXECUTION_RECORDS)
+        assert flow.datasets == datasets
+        assert [x.record.data for x in flow.failed_records] == [x[0] for x in failed]
+
+
+def test_batch_execution_parallel_instant_fail():
+    config = {
+        **BATCH_EXECUTION_CONFIG,
+        "execution": "batch",
+        "instant_fail": True,
+        "parallel": True,
+        "executor": "thread",
+        "cores": 1,
+        "batch": 3,
+    }
+    with Flow(config=config) as flow:
+        with pytest.raises(FlowInstantFailException):
+            flow.process(BATCH_EXECUTION_RECORDS)
+
+
+def test_batch_execution_failed():
+    flow = Flow(config={**BATCH_EXECUTION_CONFIG, "execution": "batch"})
+    with patch.object(Transformation, "execute_batch", side_effect=ZeroDivisionError("error")):
+        with pytest.raises(FlowFailedException):
+            flow.process(BATCH_EXECUTION_RECORDS)
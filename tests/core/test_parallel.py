@@ -0,0 +1,87 @@
+import os
+import pytest
+from multiprocessing import Event
+from pytransflow.exceptions import FlowPipelineInstantFailException, OutputAlreadyExistsException
+from pytransflow.core.flow.dataset import FailedDataset
+from pytransflow.core.record import Record
+from pytransflow.core.flow.parallel import WorkerState, initialize_worker, process_batch
+from pytransflow.core.flow.configuration import FlowConfiguration
+from pytransflow.core.flow.schema import FlowSchema
+
+
+def test_process_batch_in_worker():
+    config = FlowConfiguration(
+        FlowSchema(transformations=[{"add_field": {"name": "a", "value": "b"}}])
+    )
+    initialize_worker(config.transformations, False, Event())
+    result = process_batch([Record({}), Record({"c": "d"})])
+    WorkerState.pipeline = None
+    WorkerState.cancelled = None
+
+    assert result.worker == os.getpid()
+    assert result.busy_time >= 0
+    assert result.size == 2
+    assert result.datasets == {"default": [{"a": "b"}, {"c": "d", "a": "b"}]}
+    assert result.failures == []
+
+
+def test_process_batch_cancelled():
+    config = FlowConfiguration(
+        FlowSchema(transformations=[{"add_field": {"name": "a", "value": "b"}}])
+    )
+    cancelled = Event()
+    cancelled.set()
+    initialize_worker(config.transformations, False, cancelled)
+    result = process_batch([Record({}), Record({})])
+    WorkerState.pipeline = None
+    WorkerState.cancelled = None
+
+    assert result.size == 0
+    assert result.datasets == {}
+
+
+def test_process_batch_instant_fail():
+    config = FlowConfiguration(
+        FlowSchema(
+            instant_fail=True,
+            transformations=[{"add_field": {"name": "a", "value": "b"}}],
+        )
+    )
+    cancelled = Event()
+    initialize_worker(config.transformations, True, cancelled)
+    with pytest.raises(FlowPipelineInstantFailException):
+        process_batch([Record({"a": "b"}), Record({})])
+    WorkerState.pipeline = None
+    WorkerState.cancelled = None
+
+    assert cancelled.is_set()
+
+
+def test_process_batch_compact_failures():
+    config = FlowConfiguration(
+        FlowSchema(
+            transformations=[
+                {"add_field": {"name": "x", "value": "y"}},
+                {"add_field": {"name": "a", "value": "b"}},
+            ]
+        )
+    )
+    initialize_worker(config.transformations, False, Event())
+    result = process_batch([Record({}), Record({"a": "c"})])
+    WorkerState.pipeline = None
+    WorkerState.cancelled = None
+
+    assert result.datasets == {"default": [{"x": "y", "a": "b"}]}
+    assert len(result.failures) == 1
+    failure = result.failures[0]
+    assert failure.record == {"a": "c", "x": "y"}
+    assert [(i, data) for i, data, _ in failure.failures] == [(1, {"a": "c", "x": "y"})]
+
+    dataset = FailedDataset.from_compact(failure, config.transformations)
+    assert dataset.record == {"a": "c", "x": "y"}
+    assert len(dataset.run_id) == 36
+    assert dataset.run_id == dataset.run_id
+    failed_record = dataset.failed_records[0]
+    assert failed_record.transformation_name == "AddFieldTransformation"
+    assert failed_record.transformation_configuration is config.transformations[1].config
+    assert isinstance(failed_record.error, OutputAlreadyExistsException)
@@ -176,6 +176,7 @@ def test_equal_failed_records():
                 "input_datasets": ["default"],
                 "output_datasets": ["default"],
                 "condition": None,
+                "concurrency": None,
                 "output_fields": ["output"],
                 "required_in_record": ["b"],
                 "ignore_errors": [],
@@ -195,6 +196,7 @@ def test_equal_failed_records():
                 "input_datasets": ["default"],
                 "output_datasets": ["default"],
                 "condition": None,
+                "concurrency": None,
                 "output_fields": ["output"],
                 "required_in_record": ["b"],
                 "ignore_errors": [],
@@ -222,6 +224,7 @@ def test_equal_failed_record(value):
                 "input_datasets": ["default"],
                 "output_datasets": ["default"],
                 "condition": None,
+                "concurrency": None,
                 "output_fields": ["output"],
                 "required_in_record": ["b"],
                 "ignore_errors": [],
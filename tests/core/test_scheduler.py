@@ -0,0 +1,43 @@
+from pytransflow.core.flow.scheduler import BatchScheduler
+
+
+def test_scheduler_fixed_batch():
+    scheduler = BatchScheduler(cores=2, batch=3)
+    assert scheduler.plan(8) == [3, 3, 2]
+
+
+def test_scheduler_guided():
+    scheduler = BatchScheduler(cores=2, batch=None)
+    sizes = scheduler.plan(100)
+    assert sum(sizes) == 100
+    assert sizes[:4] == [25, 19, 14, 11]
+    assert sizes == sorted(sizes, reverse=True)
+    assert sizes[-1] == 1
+
+
+def test_scheduler_empty():
+    scheduler = BatchScheduler(cores=4, batch=None)
+    assert scheduler.plan(0) == []
+
+
+def test_scheduler_cost_per_record():
+    scheduler = BatchScheduler(cores=2, batch=None)
+    scheduler.update(0, 1.0)
+    assert scheduler.cost_per_record is None
+
+    scheduler.update(100, 0.1)
+    assert scheduler.cost_per_record == 0.001
+    scheduler.update(100, 0.3)
+    assert round(scheduler.cost_per_record, 6) == 0.002
+
+    sizes = scheduler.plan(100)
+    assert sum(sizes) == 100
+    assert min(sizes[:-1]) >= 5
+
+
+def test_scheduler_unknown_length():
+    scheduler = BatchScheduler(cores=2, batch=None)
+    assert scheduler.next_size(None) == BatchScheduler.stream_batch_size
+    scheduler.update(10, 0.01)
+    assert scheduler.next_size(None) == 10
+    assert BatchScheduler(cores=2, batch=7).next_size(None) == 7
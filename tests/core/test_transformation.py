@@ -46,6 +46,7 @@ def test_transformation_init_without_output_datasets():
         "ignore_errors": [],
         "output_datasets": ["new_1", "new_2"],
         "condition": None,
+        "concurrency": None,
         "output_fields": ["b"],
         "required_in_record": ['a'],
     }
@@ -68,6 +69,7 @@ def test_transformation_init_with_output_datasets():
         "ignore_errors": [],
         "output_datasets": ["new_3"],
         "condition": None,
+        "concurrency": None,
         "output_fields": ["b"],
         "required_in_record": ['a'],
     }
@@ -92,6 +94,7 @@ def test_transformation_repr():
         "output_datasets=['new_3'], "
         "ignore_errors=[], "
         "condition=None, "
+        "concurrency=None, "
         "required_in_record=['a'], "
         "output_fields=['b'], "
         "field=a, "